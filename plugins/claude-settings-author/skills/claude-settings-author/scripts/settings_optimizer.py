@@ -9,23 +9,87 @@ and suggests migrating WebFetch domains to sandbox network allowlists.
 
 import json
 import argparse
-import shutil
+import os
 import re
+import shutil
+import stat
+import sys
+import tempfile
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Set, Optional, Tuple
-
-try:
-    from colorama import Fore, Style, init as colorama_init
-    colorama_init(autoreset=True)
-    HAS_COLOR = True
-except ImportError:
+from typing import List, Dict, FrozenSet, Set, Optional, Tuple
+
+# Color only for terminals; piped output gets plain text and no stream wrapping
+HAS_COLOR = False
+if sys.stdout.isatty():
+    try:
+        from colorama import Fore, Style, init as colorama_init
+        colorama_init(autoreset=True)
+        HAS_COLOR = True
+    except ImportError:
+        pass
+
+if not HAS_COLOR:
     class Fore:
         RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = ""
     class Style:
         BRIGHT = RESET_ALL = ""
-    HAS_COLOR = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def read_json(path: Path):
+    """Read a JSON file (orjson when available)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, data) -> None:
+    """Write a JSON file with 2-space indent and trailing newline
+
+    The file is replaced atomically (temp file + os.replace) rather than
+    rewritten in place, so hardlinked backups keep the old contents. A
+    symlinked settings file is written through to its target, and the
+    file's permissions are kept.
+    """
+    if HAS_ORJSON:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        raw = (json.dumps(data, indent=2) + '\n').encode('utf-8')
+
+    target = Path(os.path.realpath(path))
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except OSError:
+        mode = 0o644
+
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        try:
+            f = os.fdopen(fd, 'wb')
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            f.write(raw)
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# Permission locations, interned so comparisons and hashes are pointer-cheap
+LOC_GLOBAL = sys.intern("Global")
+LOC_PROJECT = sys.intern("Project")
 
 
 class IssueType(Enum):
@@ -37,11 +101,11 @@ class IssueType(Enum):
     GOOD = "good"
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """Represents a single permission entry"""
     pattern: str
-    location: str  # "Global" or "Project"
+    location: str  # LOC_GLOBAL or LOC_PROJECT
 
     def __hash__(self):
         return hash((self.pattern, self.location))
@@ -50,7 +114,33 @@ class Permission:
         return self.pattern == other.pattern and self.location == other.location
 
 
-@dataclass
+@dataclass(slots=True)
+class ParsedPermission:
+    """A permission pattern split into tool and arguments once"""
+    raw: str
+    tool: str
+    args: Optional[str]  # None when the pattern has no "(...)"
+    command_prefix: Optional[str] = None  # "git" for args "git:*"
+
+    @staticmethod
+    def tool_of(pattern: str) -> str:
+        """Tool name of a pattern, without parsing its arguments"""
+        paren = pattern.find('(')
+        return pattern if paren < 0 else pattern[:paren]
+
+    @classmethod
+    def parse(cls, pattern: str) -> "ParsedPermission":
+        """Parse "Tool(args)" or a bare "Tool" pattern"""
+        paren = pattern.find('(')
+        if paren < 0:
+            return cls(pattern, pattern, None)
+
+        args = pattern[paren+1:-1] if pattern.endswith(')') else ""
+        prefix = args[:-2] if args.endswith(":*") else None
+        return cls(pattern, pattern[:paren], args, prefix)
+
+
+@dataclass(slots=True)
 class Issue:
     """Represents a permission issue"""
     permission: Permission
@@ -64,7 +154,7 @@ class Issue:
 class SettingsOptimizer:
     """Analyzes and optimizes Claude Code permission settings"""
 
-    DANGEROUS_PATTERNS = {
+    DANGEROUS_PATTERNS = frozenset({
         "Bash(*:*)",
         "Read(/*)",
         "Write(/*)",
@@ -72,38 +162,62 @@ class SettingsOptimizer:
         "Bash(rm:*)",
         "Bash(sudo:*)",
         "Skill(*)",
-    }
+    })
+
+    WEBFETCH_DOMAIN_PREFIX = "WebFetch(domain:"
+
+    # Patterns that grant this skill itself
+    SELF_SKILL_PATTERNS = frozenset({
+        "Skill(claude-settings-optimizer)",
+        "Skill(settings-cleaner)",
+        "Skill(*)",
+    })
+
+    # Bash(args) where args has a space and no ":*"; captures the first word
+    _OVERLY_SPECIFIC_RE = re.compile(r'Bash\((?=[^ ]* )(?!.*:\*)\s*(\S+).*\)', re.DOTALL)
 
     def __init__(self, global_path: Optional[Path] = None, project_path: Optional[Path] = None):
         """Initialize with custom paths or use defaults"""
         self.global_path = global_path or Path.home() / ".claude" / "settings.json"
         self.project_path = project_path or Path.cwd() / ".claude" / "settings.local.json"
 
-        self.global_permissions: Set[str] = set()
-        self.project_permissions: Set[str] = set()
+        # Read-only after load; fixes work on mutable copies
+        self.global_permissions: FrozenSet[str] = frozenset()
+        self.project_permissions: FrozenSet[str] = frozenset()
         self.project_sandbox_network_allow: Set[str] = set()
         self.issues: List[Issue] = []
+        # Parsed settings files as loaded, reused (and updated) when saving
+        self._global_data: Optional[Dict] = None
+        self._project_data: Optional[Dict] = None
+        # Project pattern -> covering global pattern (None if uncovered)
+        self._coverage_cache: Dict[str, Optional[str]] = {}
+        # Tool name -> parsed global patterns for that tool (built lazily)
+        self._global_by_tool: Optional[Dict[str, List[ParsedPermission]]] = None
+        # Tool name -> {cmd: bucket position} for globals that can only cover
+        # through their "cmd:*" prefix, and (position, global) for the rest
+        self._global_prefixes: Dict[str, Dict[str, int]] = {}
+        self._global_others: Dict[str, List[Tuple[int, ParsedPermission]]] = {}
 
     def load_settings(self) -> bool:
         """Load settings from both global and project files"""
         try:
             if self.global_path.exists():
-                with open(self.global_path, 'r') as f:
-                    global_data = json.load(f)
-                    self.global_permissions = set(
-                        global_data.get("permissions", {}).get("allow", [])
-                    )
+                global_data = read_json(self.global_path)
+                self._global_data = global_data
+                self.global_permissions = frozenset(
+                    global_data.get("permissions", {}).get("allow", [])
+                )
 
             if self.project_path.exists():
-                with open(self.project_path, 'r') as f:
-                    project_data = json.load(f)
-                    self.project_permissions = set(
-                        project_data.get("permissions", {}).get("allow", [])
-                    )
-                    # Load sandbox network allowlist
-                    sandbox = project_data.get("sandbox", {})
-                    network_perms = sandbox.get("permissions", {}).get("network", {})
-                    self.project_sandbox_network_allow = set(network_perms.get("allow", []))
+                project_data = read_json(self.project_path)
+                self._project_data = project_data
+                self.project_permissions = frozenset(
+                    project_data.get("permissions", {}).get("allow", [])
+                )
+                # Load sandbox network allowlist
+                sandbox = project_data.get("sandbox", {})
+                network_perms = sandbox.get("permissions", {}).get("network", {})
+                self.project_sandbox_network_allow = set(network_perms.get("allow", []))
 
             if not self.global_permissions and not self.project_permissions:
                 print(f"{Fore.YELLOW}No permissions found in settings files.{Style.RESET_ALL}")
@@ -124,46 +238,98 @@ class SettingsOptimizer:
 
     def is_overly_specific(self, pattern: str) -> Tuple[bool, Optional[str]]:
         """Check if pattern is overly specific (exact command with arguments)"""
-        if not pattern.startswith("Bash("):
-            return False, None
-
-        if not pattern.endswith(")"):
-            return False, None
-
-        args = pattern[5:-1]
-
-        if ":*" in args or args == "*:*":
-            return False, None
-
-        if " " in args:
-            base_cmd = args.split()[0]
-            suggestion = f"Bash({base_cmd}:*)"
-            return True, suggestion
-
+        match = self._OVERLY_SPECIFIC_RE.fullmatch(pattern)
+        if match:
+            return True, f"Bash({match.group(1)}:*)"
         return False, None
 
     def extract_webfetch_domain(self, pattern: str) -> Optional[str]:
         """Extract domain from WebFetch(domain:X) pattern"""
-        match = re.match(r'^WebFetch\(domain:([^)]+)\)$', pattern)
-        return match.group(1) if match else None
+        if not (pattern.startswith(self.WEBFETCH_DOMAIN_PREFIX) and pattern.endswith(")")):
+            return None
+        domain = pattern[len(self.WEBFETCH_DOMAIN_PREFIX):-1]
+        return domain if domain and ")" not in domain else None
+
+    @staticmethod
+    def _is_prefix_only(general: ParsedPermission) -> bool:
+        """Check if 'general' can only cover patterns through its "cmd:*" prefix"""
+        return (
+            general.command_prefix is not None
+            and general.args not in ("*:*", "domain:*")
+            and general.tool not in ("Read", "Write", "Edit")
+        )
+
+    def _index_globals(self):
+        """Bucket parsed globals by tool and index "cmd:*" globals by cmd"""
+        self._global_by_tool = {}
+        self._global_prefixes = {}
+        self._global_others = {}
+        for pattern in self.global_permissions:
+            parsed = ParsedPermission.parse(pattern)
+            bucket = self._global_by_tool.setdefault(parsed.tool, [])
+            if self._is_prefix_only(parsed):
+                self._global_prefixes.setdefault(parsed.tool, {})[parsed.command_prefix] = len(bucket)
+            else:
+                self._global_others.setdefault(parsed.tool, []).append((len(bucket), parsed))
+            bucket.append(parsed)
+
+    def _globals_for_tool(self, tool: str) -> List[ParsedPermission]:
+        """Parsed global patterns for one tool; only these can cover its patterns"""
+        if self._global_by_tool is None:
+            self._index_globals()
+        return self._global_by_tool.get(tool, [])
+
+    def _find_covering(self, specific: ParsedPermission) -> Optional[str]:
+        """First global (in bucket order) that covers 'specific'
+
+        "cmd:*" globals are found by looking up each prefix of the args that
+        ends at a word or ":" boundary, one dict lookup per boundary instead
+        of a startswith test per global. The remaining globals are checked
+        in order, up to the earliest prefix hit.
+        """
+        bucket = self._globals_for_tool(specific.tool)
+        best = len(bucket)
+
+        prefixes = self._global_prefixes.get(specific.tool)
+        if prefixes and specific.args is not None:
+            args = specific.args
+            for i in range(len(args) + 1):
+                if i == len(args) or args[i] in " :":
+                    pos = prefixes.get(args[:i])
+                    if pos is not None and pos < best:
+                        best = pos
+
+        for pos, general in self._global_others.get(specific.tool, []):
+            if pos >= best:
+                break
+            if self._covers(specific, general):
+                return general.raw
+
+        return bucket[best].raw if best < len(bucket) else None
 
     def is_pattern_subset(self, specific: str, general: str) -> bool:
         """Check if 'specific' pattern is covered by 'general' pattern"""
-        spec_tool = specific.split('(')[0] if '(' in specific else specific
-        gen_tool = general.split('(')[0] if '(' in general else general
+        # Different tools never cover each other; skip parsing for them
+        if ParsedPermission.tool_of(specific) != ParsedPermission.tool_of(general):
+            return False
+        return self._covers(ParsedPermission.parse(specific), ParsedPermission.parse(general))
 
-        if spec_tool != gen_tool:
+    @staticmethod
+    def _covers(specific: ParsedPermission, general: ParsedPermission) -> bool:
+        """is_pattern_subset on already-parsed patterns"""
+        if specific.tool != general.tool:
             return False
 
         # If general tool has no restrictions, it covers ALL variants
-        if '(' not in general:
+        if general.args is None:
             return True
 
-        if '(' not in specific:
+        if specific.args is None:
             return False
 
-        spec_args = specific[specific.index('(')+1:-1] if specific.endswith(')') else ""
-        gen_args = general[general.index('(')+1:-1] if general.endswith(')') else ""
+        spec_tool = specific.tool
+        spec_args = specific.args
+        gen_args = general.args
 
         if spec_args == gen_args:
             return True
@@ -174,8 +340,8 @@ class SettingsOptimizer:
         if gen_args == "domain:*" and spec_args.startswith("domain:"):
             return True
 
-        if gen_args.endswith(":*"):
-            base_cmd = gen_args[:-2]
+        if general.command_prefix is not None:
+            base_cmd = general.command_prefix
             if spec_args.startswith(base_cmd):
                 if spec_args == base_cmd or spec_args.startswith(base_cmd + " ") or spec_args.startswith(base_cmd + ":"):
                     return True
@@ -189,15 +355,19 @@ class SettingsOptimizer:
         return False
 
     def is_redundant(self, perm: Permission) -> Optional[Permission]:
-        """Check if a project permission is redundant (covered by global permission)"""
-        if perm.location != "Project":
+        """Check if a project permission is redundant (covered by global permission)
+
+        The covering global is memoized per pattern, so repeated checks during
+        one analysis don't rescan the global permissions.
+        """
+        if perm.location != LOC_PROJECT:
             return None
 
-        for global_perm in self.global_permissions:
-            if self.is_pattern_subset(perm.pattern, global_perm):
-                return Permission(global_perm, "Global")
+        if perm.pattern not in self._coverage_cache:
+            self._coverage_cache[perm.pattern] = self._find_covering(ParsedPermission.parse(perm.pattern))
 
-        return None
+        covering = self._coverage_cache[perm.pattern]
+        return Permission(covering, LOC_GLOBAL) if covering is not None else None
 
     def should_migrate_to_sandbox(self, perm: Permission) -> Optional[str]:
         """
@@ -208,7 +378,7 @@ class SettingsOptimizer:
         2. Covered by global permission (would be REDUNDANT)
         3. Domain NOT already in sandbox.permissions.network.allow
         """
-        if perm.location != "Project":
+        if perm.location != LOC_PROJECT:
             return None
 
         domain = self.extract_webfetch_domain(perm.pattern)
@@ -216,13 +386,7 @@ class SettingsOptimizer:
             return None
 
         # Check if covered by global (would be redundant)
-        covered = False
-        for global_perm in self.global_permissions:
-            if self.is_pattern_subset(perm.pattern, global_perm):
-                covered = True
-                break
-
-        if not covered:
+        if self.is_redundant(perm) is None:
             return None
 
         # Check if already in sandbox allowlist
@@ -233,20 +397,8 @@ class SettingsOptimizer:
 
     def detect_self_awareness(self) -> Dict:
         """Detect if this skill is in the permissions"""
-        skill_patterns = [
-            "Skill(claude-settings-optimizer)",
-            "Skill(settings-cleaner)",
-            "Skill(*)",
-        ]
-
-        found_global = []
-        found_project = []
-
-        for pattern in skill_patterns:
-            if pattern in self.global_permissions:
-                found_global.append(pattern)
-            if pattern in self.project_permissions:
-                found_project.append(pattern)
+        found_global = sorted(self.SELF_SKILL_PATTERNS & self.global_permissions)
+        found_project = sorted(self.SELF_SKILL_PATTERNS & self.project_permissions)
 
         return {
             "is_self_aware": bool(found_global or found_project),
@@ -256,44 +408,58 @@ class SettingsOptimizer:
 
     def analyze(self) -> Dict[IssueType, List[Issue]]:
         """Analyze all permissions and categorize issues"""
-        self.issues = []
+        # Issues are grouped by type as they are classified
+        grouped: Dict[IssueType, List[Issue]] = {issue_type: [] for issue_type in IssueType}
+
+        def add(issue: Issue):
+            grouped[issue.issue_type].append(issue)
+
+        self._coverage_cache = {}
+        self._global_by_tool = None
 
         # Analyze global permissions
         for pattern in self.global_permissions:
-            perm = Permission(pattern, "Global")
+            perm = Permission(pattern, LOC_GLOBAL)
 
-            if self.is_dangerous(pattern):
-                self.issues.append(Issue(
+            if pattern in self.DANGEROUS_PATTERNS:
+                add(Issue(
                     perm, IssueType.DANGEROUS,
                     "Allows unrestricted access"
                 ))
             else:
-                is_specific, suggestion = self.is_overly_specific(pattern)
+                # Only Bash(...) patterns can be overly specific
+                is_specific, suggestion = (
+                    self.is_overly_specific(pattern) if pattern.startswith("Bash(") else (False, None)
+                )
                 if is_specific:
-                    self.issues.append(Issue(
+                    add(Issue(
                         perm, IssueType.SPECIFIC,
                         "Hardcoded arguments should be generalized",
                         suggestion=suggestion
                     ))
                 else:
-                    self.issues.append(Issue(perm, IssueType.GOOD, ""))
+                    add(Issue(perm, IssueType.GOOD, ""))
 
         # Analyze project permissions
         for pattern in self.project_permissions:
-            perm = Permission(pattern, "Project")
+            perm = Permission(pattern, LOC_PROJECT)
 
-            if self.is_dangerous(pattern):
-                self.issues.append(Issue(
+            if pattern in self.DANGEROUS_PATTERNS:
+                add(Issue(
                     perm, IssueType.DANGEROUS,
                     "Allows unrestricted access"
                 ))
                 continue
 
+            # Only globals for the same tool can cover a pattern; with none,
+            # the migration and redundancy checks can't match
+            has_globals = bool(self._globals_for_tool(ParsedPermission.tool_of(pattern)))
+
             # Check for sandbox migration first (more specific than redundant)
-            migrate_domain = self.should_migrate_to_sandbox(perm)
+            migrate_domain = self.should_migrate_to_sandbox(perm) if has_globals else None
             if migrate_domain:
                 covered_by = self.is_redundant(perm)
-                self.issues.append(Issue(
+                add(Issue(
                     perm, IssueType.MIGRATE_TO_SANDBOX,
                     "Redundant for WebFetch but needed for Bash network access",
                     covered_by=covered_by,
@@ -302,38 +468,29 @@ class SettingsOptimizer:
                 continue
 
             # Check redundancy
-            covered_by = self.is_redundant(perm)
+            covered_by = self.is_redundant(perm) if has_globals else None
             if covered_by:
-                self.issues.append(Issue(
+                add(Issue(
                     perm, IssueType.REDUNDANT,
                     "Covered by global permission",
                     covered_by=covered_by
                 ))
                 continue
 
-            # Check overly specific
-            is_specific, suggestion = self.is_overly_specific(pattern)
+            # Check overly specific (only Bash(...) patterns can be)
+            is_specific, suggestion = (
+                self.is_overly_specific(pattern) if pattern.startswith("Bash(") else (False, None)
+            )
             if is_specific:
-                self.issues.append(Issue(
+                add(Issue(
                     perm, IssueType.SPECIFIC,
                     "Hardcoded arguments should be generalized",
                     suggestion=suggestion
                 ))
             else:
-                self.issues.append(Issue(perm, IssueType.GOOD, ""))
-
-        # Group by issue type
-        grouped = {
-            IssueType.DANGEROUS: [],
-            IssueType.SPECIFIC: [],
-            IssueType.REDUNDANT: [],
-            IssueType.MIGRATE_TO_SANDBOX: [],
-            IssueType.GOOD: []
-        }
-
-        for issue in self.issues:
-            grouped[issue.issue_type].append(issue)
+                add(Issue(perm, IssueType.GOOD, ""))
 
+        self.issues = [issue for issues in grouped.values() for issue in issues]
         return grouped
 
     def print_report(self, grouped: Dict[IssueType, List[Issue]]):
@@ -424,39 +581,60 @@ class SettingsOptimizer:
             return True
 
         backup_path = filepath.with_suffix(filepath.suffix + ".bak")
+        # The new backup is built under a temp name and swapped in, so the
+        # previous .bak survives until it is known to have succeeded
+        tmp = None
         try:
-            shutil.copy2(filepath, backup_path)
+            fd, tmp = tempfile.mkstemp(dir=backup_path.parent, prefix=f".{backup_path.name}.", suffix=".tmp")
+            os.close(fd)
+            try:
+                # Settings are replaced, never rewritten in place (see
+                # write_json), so a hardlink to the current file is a stable
+                # backup; link() won't overwrite, so the placeholder goes first
+                os.unlink(tmp)
+                os.link(filepath, tmp)
+            except OSError:
+                # Cross-device, or links unsupported: copy into a fresh 0600
+                # temp file, then give it the source's mode (settings can
+                # hold secrets in their env block)
+                fd, tmp = tempfile.mkstemp(dir=backup_path.parent, prefix=f".{backup_path.name}.", suffix=".tmp")
+                os.close(fd)
+                shutil.copyfile(filepath, tmp)
+                shutil.copymode(filepath, tmp)
+            os.replace(tmp, backup_path)
             print(f"{Fore.CYAN}Creating backup: {backup_path}{Style.RESET_ALL}")
             return True
         except Exception as e:
+            if tmp is not None:
+                Path(tmp).unlink(missing_ok=True)
             print(f"{Fore.RED}Error creating backup: {e}{Style.RESET_ALL}")
             return False
 
     def save_settings(self, global_perms: Set[str], project_perms: Set[str],
                       sandbox_network_allow: Optional[Set[str]] = None) -> bool:
-        """Save updated permissions back to files"""
+        """Save updated permissions back to files
+
+        Updates the settings parsed by load_settings instead of re-reading
+        them; only files that existed at load time are written.
+        """
         try:
             # Save global settings
-            if self.global_path.exists():
-                with open(self.global_path, 'r') as f:
-                    global_data = json.load(f)
+            if self._global_data is not None:
+                global_data = self._global_data
 
                 if "permissions" not in global_data:
                     global_data["permissions"] = {}
-                global_data["permissions"]["allow"] = sorted(list(global_perms))
+                global_data["permissions"]["allow"] = sorted(global_perms)
 
-                with open(self.global_path, 'w') as f:
-                    json.dump(global_data, f, indent=2)
-                    f.write('\n')
+                write_json(self.global_path, global_data)
 
             # Save project settings
-            if self.project_path.exists():
-                with open(self.project_path, 'r') as f:
-                    project_data = json.load(f)
+            if self._project_data is not None:
+                project_data = self._project_data
 
                 if "permissions" not in project_data:
                     project_data["permissions"] = {}
-                project_data["permissions"]["allow"] = sorted(list(project_perms))
+                project_data["permissions"]["allow"] = sorted(project_perms)
 
                 # Update sandbox network allowlist if provided
                 if sandbox_network_allow is not None:
@@ -466,11 +644,9 @@ class SettingsOptimizer:
                         project_data["sandbox"]["permissions"] = {}
                     if "network" not in project_data["sandbox"]["permissions"]:
                         project_data["sandbox"]["permissions"]["network"] = {}
-                    project_data["sandbox"]["permissions"]["network"]["allow"] = sorted(list(sandbox_network_allow))
+                    project_data["sandbox"]["permissions"]["network"]["allow"] = sorted(sandbox_network_allow)
 
-                with open(self.project_path, 'w') as f:
-                    json.dump(project_data, f, indent=2)
-                    f.write('\n')
+                write_json(self.project_path, project_data)
 
             return True
 
@@ -480,8 +656,8 @@ class SettingsOptimizer:
 
     def interactive_clean(self, grouped: Dict[IssueType, List[Issue]]):
         """Interactive cleanup with user confirmation for each issue"""
-        global_perms = self.global_permissions.copy()
-        project_perms = self.project_permissions.copy()
+        global_perms = set(self.global_permissions)
+        project_perms = set(self.project_permissions)
         sandbox_network = self.project_sandbox_network_allow.copy()
 
         changes = {
@@ -501,7 +677,7 @@ class SettingsOptimizer:
 
                 response = input(f"  Remove? [y/N]: ").strip().lower()
                 if response == 'y':
-                    if issue.permission.location == "Global":
+                    if issue.permission.location == LOC_GLOBAL:
                         global_perms.discard(issue.permission.pattern)
                     else:
                         project_perms.discard(issue.permission.pattern)
@@ -532,7 +708,7 @@ class SettingsOptimizer:
 
                 response = input(f"  Generalize? [y/N]: ").strip().lower()
                 if response == 'y':
-                    if issue.permission.location == "Global":
+                    if issue.permission.location == LOC_GLOBAL:
                         global_perms.discard(issue.permission.pattern)
                         global_perms.add(issue.suggestion)
                     else:
@@ -586,7 +762,7 @@ class SettingsOptimizer:
             print(f"\n{Fore.GREEN}No redundant permissions or migrations needed.{Style.RESET_ALL}")
             return
 
-        project_perms = self.project_permissions.copy()
+        project_perms = set(self.project_permissions)
         sandbox_network = self.project_sandbox_network_allow.copy()
 
         # Handle migrations
@@ -23,19 +23,46 @@ Updates version in:
 3. .claude-plugin/marketplace.json (version for that plugin)
 """
 
-import argparse
+import functools
 import json
+import os
 import re
-import subprocess
+import stat
 import sys
+import tempfile
 from pathlib import Path
 
+# Frontmatter and version line patterns, compiled once at import
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+_VERSION_RE = re.compile(r'^\s*version:\s*["\']?([^"\'\n]+)["\']?', re.MULTILINE)
+_VERSION_SUB_RE = re.compile(r'(^\s*version:\s*)["\']?[^"\'\n]+["\']?', re.MULTILINE)
+_JSON_VERSION_RE = re.compile(r'("version"\s*:\s*)"[^"\\]*"')
 
+# Optional: in-process diffs via libgit2 instead of forking git
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+
+
+# Repo root markers, probed in this order (.git is the usual hit)
+_ROOT_MARKERS = (".git", os.path.join(".claude-plugin", "marketplace.json"))
+
+
+@functools.lru_cache(maxsize=None)
 def find_repo_root(start_path: Path) -> Path | None:
-    """Find repository root by traversing upward to find .git or .claude-plugin/marketplace.json."""
+    """Find repository root by traversing upward to find .git or .claude-plugin/marketplace.json.
+
+    Each marker costs one os.stat; results are cached per start path.
+    """
     current = start_path.resolve()
     while current != current.parent:
-        if (current / ".git").exists() or (current / ".claude-plugin" / "marketplace.json").exists():
+        for marker in _ROOT_MARKERS:
+            try:
+                os.stat(os.path.join(current, marker))
+            except OSError:
+                continue
             return current
         current = current.parent
     return None
@@ -44,28 +71,36 @@ def find_repo_root(start_path: Path) -> Path | None:
 def parse_version(version_str: str) -> tuple[int, int, int]:
     """Parse a version string into (major, minor, patch) tuple."""
     # Remove quotes if present
-    version_str = version_str.strip().strip('"').strip("'")
-    parts = version_str.split(".")
-    if len(parts) != 3:
-        raise ValueError(f"Invalid version format: {version_str}")
-    return int(parts[0]), int(parts[1]), int(parts[2])
+    version_str = version_str.strip().strip("\"'")
+    try:
+        major, minor, patch = version_str.split(".")
+    except ValueError:
+        raise ValueError(f"Invalid version format: {version_str}") from None
+    return int(major), int(minor), int(patch)
 
 
 def bump_version(version_str: str, bump_type: str) -> str:
     """Bump version based on type: major, minor, or patch."""
     major, minor, patch = parse_version(version_str)
 
-    if bump_type == "major":
-        return f"{major + 1}.0.0"
-    elif bump_type == "minor":
-        return f"{major}.{minor + 1}.0"
-    else:  # patch
-        return f"{major}.{minor}.{patch + 1}"
+    match bump_type:
+        case "major":
+            return f"{major + 1}.0.0"
+        case "minor":
+            return f"{major}.{minor + 1}.0"
+        case _:  # patch
+            return f"{major}.{minor}.{patch + 1}"
 
 
 def find_skill_md(plugin_dir: Path) -> Path | None:
     """Find the SKILL.md file for a plugin."""
     skills_dir = plugin_dir / "skills"
+
+    # Conventional layout: the skill is named after its plugin
+    candidate = skills_dir / plugin_dir.name / "SKILL.md"
+    if candidate.exists():
+        return candidate
+
     if not skills_dir.exists():
         return None
 
@@ -79,11 +114,19 @@ def find_skill_md(plugin_dir: Path) -> Path | None:
 
 
 def extract_version_from_skill_md(skill_md_path: Path) -> str | None:
-    """Extract version from SKILL.md frontmatter."""
-    content = skill_md_path.read_text()
+    """Extract version from SKILL.md frontmatter.
+
+    Reads the whole file on purpose: the frontmatter regex backtracks over
+    the whitespace after the opening marker, so a match on a prefix of the
+    file can differ from a match on all of it. SKILL.md files are small.
+    """
+    return _extract_version(skill_md_path.read_text(encoding="utf-8"))
 
+
+def _extract_version(content: str) -> str | None:
+    """Extract version from already-read SKILL.md content."""
     # Match YAML frontmatter between --- markers
-    match = re.search(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
+    match = _FRONTMATTER_RE.search(content)
     if not match:
         return None
 
@@ -91,45 +134,120 @@ def extract_version_from_skill_md(skill_md_path: Path) -> str | None:
 
     # Find version in metadata section
     # Look for: metadata:\n  ...\n  version: "X.Y.Z"
-    version_match = re.search(r'^\s*version:\s*["\']?([^"\'\n]+)["\']?', frontmatter, re.MULTILINE)
+    version_match = _VERSION_RE.search(frontmatter)
     if version_match:
         return version_match.group(1).strip()
 
     return None
 
 
-def check_uncommitted_version_change(skill_md_path: Path) -> bool:
-    """Check if version line changed in uncommitted diff.
+@functools.lru_cache(maxsize=None)
+def _uncommitted_changes(repo_root: Path) -> dict[str, list[str]]:
+    """Added/removed lines per SKILL.md in the uncommitted diff, from one git call.
 
-    Returns True if the version line has been modified (already bumped).
-    Returns False if version line is unchanged (needs bumping).
+    Keys are paths relative to repo_root; values keep their +/- marker.
+    Cached, so checking several plugins in one run forks git once.
     """
+    # Imported here: only the --check-uncommitted path forks git
+    import subprocess
+
+    # Only SKILL.md files are ever looked up, so unrelated (possibly
+    # non-UTF-8) files stay out of the diff. Explicit prefixes override
+    # diff.noprefix / diff.mnemonicPrefix, which the parser relies on.
     result = subprocess.run(
-        ["git", "diff", "--", str(skill_md_path)],
-        capture_output=True, text=True
+        ["git", "-C", str(repo_root), "diff", "-U0", "--no-color", "--no-ext-diff", "--relative",
+         "--src-prefix=a/", "--dst-prefix=b/", "--", "*SKILL.md"],
+        capture_output=True, text=True, encoding="utf-8", errors="replace"
     )
 
-    # Look for version line changes in diff (lines starting with + or -)
+    changes: dict[str, list[str]] = {}
+    current = None
+    in_header = False
     for line in result.stdout.splitlines():
-        if line.startswith(('+', '-')) and not line.startswith(('+++', '---')):
-            if 'version:' in line.lower():
-                return True
+        if line.startswith("diff --git "):
+            current, in_header = None, True
+        elif in_header and line.startswith("+++ "):
+            path = line[4:]
+            current = changes.setdefault(path[2:] if path.startswith("b/") else path, [])
+        elif line.startswith("@@"):
+            in_header = False
+        elif not in_header and current is not None and line.startswith(('+', '-')):
+            current.append(line)
+    return changes
+
+
+@functools.lru_cache(maxsize=None)
+def _pygit2_diff(repo_root: Path):
+    """Worktree-vs-index diff via pygit2, plus repo_root's prefix in the repo.
+
+    Returns None when pygit2 is unavailable or repo_root is not in a git repo.
+    """
+    if not HAS_PYGIT2:
+        return None
+    try:
+        git_dir = pygit2.discover_repository(str(repo_root))
+        if git_dir is None:
+            return None
+        repo = pygit2.Repository(git_dir)
+        prefix = repo_root.relative_to(Path(repo.workdir).resolve()).as_posix()
+        return repo.diff(), "" if prefix == "." else prefix + "/"
+    except (pygit2.GitError, ValueError, TypeError):
+        return None
+
+
+def _changed_lines(repo_root: Path, rel_path: str) -> list[str]:
+    """Added/removed lines (with their +/- marker) of one file in the uncommitted diff.
+
+    With pygit2 only the deltas are scanned and just the matching file's
+    patch is built; otherwise the cached `git diff` output is used.
+    """
+    found = _pygit2_diff(repo_root)
+    if found is None:
+        return _uncommitted_changes(repo_root).get(rel_path, [])
+
+    diff, prefix = found
+    for i, delta in enumerate(diff.deltas):
+        if delta.new_file.path == prefix + rel_path:
+            return [
+                line.origin + line.content.rstrip("\n")
+                for hunk in diff[i].hunks
+                for line in hunk.lines
+                if line.origin in ("+", "-")
+            ]
+    return []
+
+
+def check_uncommitted_version_change(skill_md_path: Path, repo_root: Path | None = None) -> bool:
+    """Check if version line changed in uncommitted diff.
+
+    Returns True if the version line has been modified (already bumped).
+    Returns False if version line is unchanged (needs bumping).
+    """
+    repo_root = (repo_root or find_repo_root(skill_md_path.parent) or skill_md_path.parent).resolve()
+    try:
+        rel_path = skill_md_path.resolve().relative_to(repo_root).as_posix()
+    except ValueError:
+        return False
+
+    # Look for version line changes among the file's +/- lines
+    for line in _changed_lines(repo_root, rel_path):
+        if 'version:' in line.lower():
+            return True
     return False
 
 
-def update_skill_md(skill_md_path: Path, new_version: str, dry_run: bool = False) -> bool:
-    """Update the version in SKILL.md frontmatter."""
-    content = skill_md_path.read_text()
+def update_skill_md(skill_md_path: Path, new_version: str, dry_run: bool = False,
+                    content: str | None = None) -> bool:
+    """Update the version in SKILL.md frontmatter.
+
+    Pass `content` when the file has already been read to skip reading it again.
+    """
+    if content is None:
+        content = skill_md_path.read_text()
 
     # Match and replace version in frontmatter
     # Handle both quoted and unquoted versions
-    new_content = re.sub(
-        r'(^\s*version:\s*)["\']?[^"\'\n]+["\']?',
-        f'\\1"{new_version}"',
-        content,
-        count=1,
-        flags=re.MULTILINE
-    )
+    new_content = _VERSION_SUB_RE.sub(f'\\1"{new_version}"', content, count=1)
 
     if new_content == content:
         return False
@@ -139,13 +257,56 @@ def update_skill_md(skill_md_path: Path, new_version: str, dry_run: bool = False
     return True
 
 
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file via a sibling temp file and os.replace, keeping its mode.
+
+    A symlinked file is written through to its target rather than replaced
+    by a regular file.
+    """
+    target = Path(os.path.realpath(path))
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except OSError:
+        mode = 0o644
+
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        try:
+            f = os.fdopen(fd, "w", encoding="utf-8")
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            f.write(text)
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _patch_json_version(raw: str, data: dict, new_version: str, start: int = 0) -> str:
+    """Return `raw` with the first "version" value at or after `start` set to new_version.
+
+    `data` is the already-updated document. The in-place edit keeps the
+    file's formatting and is only used if it parses back to `data`;
+    otherwise the document is re-serialized.
+    """
+    match = _JSON_VERSION_RE.search(raw, start)
+    if match:
+        patched = f'{raw[:match.start()]}{match.group(1)}"{new_version}"{raw[match.end():]}'
+        if json.loads(patched) == data:
+            return patched
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
 def update_plugin_json(plugin_json_path: Path, new_version: str, dry_run: bool = False) -> bool:
     """Update the version in plugin.json."""
     if not plugin_json_path.exists():
         return False
 
-    with open(plugin_json_path) as f:
-        data = json.load(f)
+    raw = plugin_json_path.read_text(encoding="utf-8")
+    data = json.loads(raw)
 
     old_version = data.get("version")
     if old_version == new_version:
@@ -154,9 +315,7 @@ def update_plugin_json(plugin_json_path: Path, new_version: str, dry_run: bool =
     data["version"] = new_version
 
     if not dry_run:
-        with open(plugin_json_path, "w") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")  # Add trailing newline
+        _write_atomic(plugin_json_path, _patch_json_version(raw, data, new_version))
 
     return True
 
@@ -166,8 +325,8 @@ def update_marketplace_json(marketplace_path: Path, plugin_name: str, new_versio
     if not marketplace_path.exists():
         return False
 
-    with open(marketplace_path) as f:
-        data = json.load(f)
+    raw = marketplace_path.read_text(encoding="utf-8")
+    data = json.loads(raw)
 
     plugins = data.get("plugins", [])
     updated = False
@@ -180,14 +339,17 @@ def update_marketplace_json(marketplace_path: Path, plugin_name: str, new_versio
             break
 
     if updated and not dry_run:
-        with open(marketplace_path, "w") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")  # Add trailing newline
+        # Patch the first "version" after this plugin's name
+        name_match = re.search(r'"name"\s*:\s*' + re.escape(json.dumps(plugin_name)), raw)
+        start = name_match.end() if name_match else 0
+        _write_atomic(marketplace_path, _patch_json_version(raw, data, new_version, start))
 
     return updated
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Bump version numbers for a skill plugin",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -243,7 +405,7 @@ Examples:
 
     # Handle --check-uncommitted mode
     if args.check_uncommitted:
-        if check_uncommitted_version_change(skill_md_path):
+        if check_uncommitted_version_change(skill_md_path, repo_root):
             print(f"Version already changed in uncommitted diff: {skill_md_path.relative_to(repo_root)}")
             sys.exit(0)  # Already bumped
         else:
@@ -258,8 +420,9 @@ Examples:
     plugin_json_path = plugin_dir / ".claude-plugin" / "plugin.json"
     marketplace_path = repo_root / ".claude-plugin" / "marketplace.json"
 
-    # Extract current version
-    current_version = extract_version_from_skill_md(skill_md_path)
+    # Extract current version (the content is reused for the update)
+    skill_md_content = skill_md_path.read_text()
+    current_version = _extract_version(skill_md_content)
     if not current_version:
         print(f"Error: Could not extract version from {skill_md_path}", file=sys.stderr)
         sys.exit(1)
@@ -273,7 +436,7 @@ Examples:
     # Update all files
     updates = []
 
-    if update_skill_md(skill_md_path, new_version, args.dry_run):
+    if update_skill_md(skill_md_path, new_version, args.dry_run, content=skill_md_content):
         updates.append(f"  {'Would update' if args.dry_run else 'Updated'}: {skill_md_path.relative_to(repo_root)}")
 
     if update_plugin_json(plugin_json_path, new_version, args.dry_run):
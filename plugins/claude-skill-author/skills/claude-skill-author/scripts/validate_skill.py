@@ -6,6 +6,7 @@ Usage:
     python validate_skill.py /path/to/skill-dir           # Validate skill at path
     python validate_skill.py /path/to/skill-dir --verbose # Show all details
     python validate_skill.py /path/to/skill-dir --suggest # Include optimization hints
+    python validate_skill.py plugins/*/skills/*/          # Validate several skills
 
 For plugin-bundled skills, also validates plugin.json and version sync.
 For project-level skills (.claude/skills/), skips plugin-specific checks.
@@ -13,25 +14,100 @@ For project-level skills (.claude/skills/), skips plugin-specific checks.
 Exit codes: 0 = passed, 1 = failed
 """
 
-import argparse
 import json
+import os
 import re
-import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-
-class Severity(Enum):
-    """Validation issue severity level."""
+# Batch validation: below this many skills a pool isn't worth starting
+PARALLEL_THRESHOLD = 4
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Patterns used on every validation, compiled once at import
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+_CODE_BLOCK_RE = re.compile(r'```(?:bash|sh)?\s*\n(.*?)```', re.DOTALL)
+_SCRIPT_INVOCATION_RE = re.compile(r'(?:uv run(?:\s+--\S+)*|python3?)\s+(?!-)(\S+\.py)')
+# Windows drive paths (C:\, D:\, etc.) or path-like backslash usage (\Users, \path\to)
+_WIN_PATH_RE = re.compile(r'[A-Za-z]:\\|\\[A-Za-z][A-Za-z0-9_-]*(?:\\|$)')
+_LINK_RE = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+
+# Patterns used by the --suggest checks
+_NUMBERED_STEPS_RE = re.compile(r'^\s*[1-9]\.\s+', re.MULTILINE)
+_MD_LINK_RE = re.compile(r'\[([^\]]*)\]\(([^)]+\.md)\)')
+# Table of contents headings, or a markdown link list (common TOC format).
+# ASCII-only case folding matches what str.lower() does for these phrases.
+_TOC_RE = re.compile(r'## (?:table of contents|contents|toc)|- \[', re.IGNORECASE | re.ASCII)
+# Explanations of standard operations, as (reported pattern, literal phrases)
+# in report order; plain substring checks, no regex needed
+_OBVIOUS_PATTERNS = (
+    (r'use the read tool', ('use the read tool',)),
+    (r'use the write tool', ('use the write tool',)),
+    (r'use the edit tool', ('use the edit tool',)),
+    (r'make sure the (?:file|path) exists', ('make sure the file exists', 'make sure the path exists')),
+    (r'check if the file exists', ('check if the file exists',)),
+)
+# Time-sensitive language as (group, pattern, description), in report order
+_TIME_SENSITIVE_PATTERNS = (
+    ('currently', r'currently\b', "currently"),
+    ('recently', r'recently\b', "recently"),
+    ('now', r'now\b(?!\s+(?:you|we|it))', "now"),  # Avoid "now you can" false positives
+    ('as_of', r'as of (?:version |v)?\d', "as of version X"),
+    ('before', r'before \w+ \d{4}\b', "before [month] [year]"),
+    ('after', r'after \w+ \d{4}\b', "after [month] [year]"),
+    ('in_year', r'in \d{4}\b', "in [year]"),
+    ('since', r'since \d{4}\b', "since [year]"),
+    ('upcoming', r'upcoming\b', "upcoming"),
+    ('soon', r'soon\b', "soon"),
+    ('latest', r'latest\b', "latest"),
+    ('new', r'new(?:ly)?\b', "new/newly"),
+)
+# All of the above in one scan. Each starts at a word boundary with a distinct
+# word, so at most one can match per position; the lookahead keeps a long
+# match (e.g. "before in 2024") from hiding another inside it.
+_TIME_SENSITIVE_RE = re.compile(r'\b(?=' + '|'.join(
+    f'(?P<{group}>{pattern})' for group, pattern, _ in _TIME_SENSITIVE_PATTERNS
+) + ')')
+# MCP tool references without the mcp__ prefix
+_UNQUALIFIED_MCP_PATTERNS = [re.compile(p) for p in (
+    r'\bchat\s*\(\s*prompt',  # chat(prompt...) without mcp__ prefix
+    r'`chat`\s*tool',
+    r'the\s+chat\s+tool',
+    r'generate_image\s*\(',
+    r'`generate_image`',
+)]
+
+# Generic words that make a skill name vague
+_VAGUE_TERMS = frozenset({
+    'helper', 'helpers',
+    'util', 'utils', 'utility', 'utilities',
+    'tool', 'tools',
+    'document', 'documents',
+    'data',
+    'file', 'files',
+    'misc', 'miscellaneous',
+    'common',
+    'general',
+    'stuff',
+    'thing', 'things',
+})
+
+
+class Severity(str, Enum):
+    """Validation issue severity level (compares equal to its name string)."""
     ERROR = "ERROR"
     WARNING = "WARNING"
     SUGGESTION = "SUGGESTION"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     """A single validation issue."""
     severity: Severity
@@ -43,7 +119,7 @@ class ValidationIssue:
         return f"{self.severity.value}: {self.file_path} [{self.field}]: {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Validation result for a skill."""
     skill_path: Path
@@ -67,27 +143,35 @@ class ValidationResult:
 # YAML Frontmatter Parser (regex-based, no PyYAML dependency)
 # =============================================================================
 
-def parse_skill_md(skill_md_path: Path) -> tuple[dict[str, Any], str, int]:
+def parse_skill_md(skill_md_path: Path) -> tuple[dict[str, Any], str, int, int]:
     """
     Parse a SKILL.md file and extract frontmatter and body.
 
     Returns:
-        (frontmatter_dict, body_text, body_line_count)
+        (frontmatter_dict, body_text, body_line_count, char_count) where
+        char_count is the length of the whole file
     """
-    content = skill_md_path.read_text()
-
-    # Match YAML frontmatter between --- markers
-    match = re.search(r"^---\s*\n(.*?)\n---\s*\n?", content, re.DOTALL)
+    # One bytes read and decode; a text-mode read_text() spends more in the
+    # incremental decoder than in the read itself
+    content = skill_md_path.read_bytes().decode('utf-8')
+    if '\r' in content:
+        # Universal newlines, as text-mode reads give
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Match YAML frontmatter between --- markers (only valid at the very start)
+    match = _FRONTMATTER_RE.match(content) if content.startswith("---") else None
     if not match:
-        return {}, content, content.count('\n') + 1
+        return {}, content, content.count('\n') + 1, len(content)
 
     frontmatter_text = match.group(1)
-    body = content[match.end():]
-    body_line_count = body.count('\n') + 1 if body.strip() else 0
+    body_start = match.end()
+    body = content[body_start:]
+    # isspace() answers "blank body?" without building a stripped copy
+    body_line_count = content.count('\n', body_start) + 1 if body and not body.isspace() else 0
 
     frontmatter = parse_simple_yaml(frontmatter_text)
 
-    return frontmatter, body, body_line_count
+    return frontmatter, body, body_line_count, len(content)
 
 
 def parse_simple_yaml(text: str) -> dict[str, Any]:
@@ -97,27 +181,26 @@ def parse_simple_yaml(text: str) -> dict[str, Any]:
     - Top-level scalar values: key: value
     - Nested objects: key:\n  subkey: value
     - Quoted strings
+
+    Single pass: nested lines are written straight into their parent's
+    dict, which is created on the first indented line under the key.
     """
     result: dict[str, Any] = {}
-    lines = text.split('\n')
     current_key = None
-    nested_content: list[str] = []
+    nested: dict[str, Any] | None = None
 
-    for line in lines:
-        if not line.strip() or line.strip().startswith('#'):
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
             continue
 
         indent = len(line) - len(line.lstrip())
-        stripped = line.strip()
+        key, colon, value = stripped.partition(':')
 
-        if indent == 0 and ':' in stripped:
-            if current_key and nested_content:
-                result[current_key] = parse_nested_yaml(nested_content)
-                nested_content = []
-
-            key, _, value = stripped.partition(':')
+        if indent == 0 and colon:
             key = key.strip()
             value = value.strip()
+            nested = None
 
             if value:
                 result[key] = parse_yaml_value(value)
@@ -125,25 +208,12 @@ def parse_simple_yaml(text: str) -> dict[str, Any]:
             else:
                 current_key = key
         elif current_key and indent > 0:
-            nested_content.append(line)
-
-    if current_key and nested_content:
-        result[current_key] = parse_nested_yaml(nested_content)
-
-    return result
-
-
-def parse_nested_yaml(lines: list[str]) -> dict[str, Any]:
-    """Parse nested YAML content (one level deep)."""
-    result: dict[str, Any] = {}
-    for line in lines:
-        stripped = line.strip()
-        if ':' in stripped and not stripped.startswith('#'):
-            key, _, value = stripped.partition(':')
-            key = key.strip()
+            if nested is None:
+                nested = result[current_key] = {}
             value = value.strip()
-            if value:
-                result[key] = parse_yaml_value(value)
+            if colon and value:
+                nested[key.strip()] = parse_yaml_value(value)
+
     return result
 
 
@@ -191,23 +261,24 @@ def validate_name(
             f"'name' exceeds 64 characters ({len(name)} chars)"
         ))
 
-    if not re.match(r'^[a-z0-9-]+$', name):
+    if not _NAME_RE.fullmatch(name):
         issues.append(ValidationIssue(
             Severity.ERROR, file_path, "name",
             f"'name' must contain only lowercase letters, numbers, and hyphens (got: '{name}')"
         ))
+    else:
+        # Hyphen placement is only checked once the characters are valid
+        if name.startswith('-') or name.endswith('-'):
+            issues.append(ValidationIssue(
+                Severity.ERROR, file_path, "name",
+                f"'name' cannot start or end with a hyphen (got: '{name}')"
+            ))
 
-    if name.startswith('-') or name.endswith('-'):
-        issues.append(ValidationIssue(
-            Severity.ERROR, file_path, "name",
-            f"'name' cannot start or end with a hyphen (got: '{name}')"
-        ))
-
-    if '--' in name:
-        issues.append(ValidationIssue(
-            Severity.ERROR, file_path, "name",
-            f"'name' cannot contain consecutive hyphens (got: '{name}')"
-        ))
+        if '--' in name:
+            issues.append(ValidationIssue(
+                Severity.ERROR, file_path, "name",
+                f"'name' cannot contain consecutive hyphens (got: '{name}')"
+            ))
 
     if name != skill_dir_name:
         issues.append(ValidationIssue(
@@ -310,27 +381,18 @@ def validate_body(body_line_count: int, file_path: str) -> list[ValidationIssue]
 
 
 def validate_character_budget(
-    skill_md_path: Path,
+    char_count: int,
     file_path: str,
     char_budget: int = 15000
 ) -> list[ValidationIssue]:
-    """Validate skill file size is within context budget."""
+    """Validate skill file size (in characters, from parse_skill_md) is within context budget."""
     issues = []
 
-    try:
-        content = skill_md_path.read_text()
-        char_count = len(content)
-
-        if char_count > char_budget:
-            issues.append(ValidationIssue(
-                Severity.ERROR, file_path, "character-budget",
-                f"SKILL.md exceeds context budget ({char_count:,} chars, limit: {char_budget:,}). "
-                f"Skill must be compressed. See references/compression-guide.md."
-            ))
-    except Exception as e:
+    if char_count > char_budget:
         issues.append(ValidationIssue(
             Severity.ERROR, file_path, "character-budget",
-            f"Could not read file: {e}"
+            f"SKILL.md exceeds context budget ({char_count:,} chars, limit: {char_budget:,}). "
+            f"Skill must be compressed. See references/compression-guide.md."
         ))
 
     return issues
@@ -380,7 +442,7 @@ def validate_script_paths_use_skill_dir(body: str, file_path: str) -> list[Valid
         return issues
 
     # Extract bash code blocks
-    code_blocks = re.findall(r'```(?:bash|sh)?\s*\n(.*?)```', body, re.DOTALL)
+    code_blocks = _CODE_BLOCK_RE.findall(body)
 
     for block in code_blocks:
         for line in block.strip().split('\n'):
@@ -390,11 +452,7 @@ def validate_script_paths_use_skill_dir(body: str, file_path: str) -> list[Valid
 
             # Match uv run or python/python3 commands with a script path argument
             # Look for patterns like: uv run scripts/foo.py or python scripts/foo.py
-            match = re.search(
-                r'(?:uv run(?:\s+--\S+)*|python3?)\s+(?!-)'
-                r'(\S+\.py)',
-                line
-            )
+            match = _SCRIPT_INVOCATION_RE.search(line)
             if not match:
                 continue
 
@@ -437,13 +495,8 @@ def validate_no_windows_paths(body: str, file_path: str) -> list[ValidationIssue
     if not body.strip():
         return issues
 
-    # Pattern for Windows drive paths (C:\, D:\, etc.)
-    drive_pattern = r'[A-Za-z]:\\'
-
-    # Pattern for path-like backslash usage (e.g., \Users, \path\to)
-    path_pattern = r'\\[A-Za-z][A-Za-z0-9_-]*(?:\\|$)'
-
-    if re.search(drive_pattern, body) or re.search(path_pattern, body):
+    # Both path shapes need a backslash; most bodies have none
+    if '\\' in body and _WIN_PATH_RE.search(body):
         issues.append(ValidationIssue(
             Severity.WARNING, file_path, "body",
             "Windows-style path detected. Use forward slashes '/' for cross-platform compatibility."
@@ -465,28 +518,13 @@ def validate_vague_names(name: str | None, file_path: str) -> list[ValidationIss
     if not name:
         return issues
 
-    vague_terms = [
-        'helper', 'helpers',
-        'util', 'utils', 'utility', 'utilities',
-        'tool', 'tools',
-        'document', 'documents',
-        'data',
-        'file', 'files',
-        'misc', 'miscellaneous',
-        'common',
-        'general',
-        'stuff',
-        'thing', 'things',
-    ]
-
-    name_parts = name.lower().split('-')
-    for term in vague_terms:
-        if term in name_parts:
-            issues.append(ValidationIssue(
-                Severity.WARNING, file_path, "name",
-                f"Name contains vague term '{term}'. Prefer descriptive names that indicate specific functionality."
-            ))
-            break
+    # First vague name part, in name order
+    vague_term = next((part for part in name.lower().split('-') if part in _VAGUE_TERMS), None)
+    if vague_term:
+        issues.append(ValidationIssue(
+            Severity.WARNING, file_path, "name",
+            f"Name contains vague term '{vague_term}'. Prefer descriptive names that indicate specific functionality."
+        ))
 
     return issues
 
@@ -509,11 +547,17 @@ def validate_referenced_files_exist(
     if not body.strip():
         return issues
 
-    # Pattern for markdown links: [text](path) where path is relative
-    # Excludes http/https URLs and anchors (#)
-    link_pattern = r'\[([^\]]*)\]\(([^)]+)\)'
+    # Every markdown link contains "](", so bodies without one have no links
+    if "](" not in body:
+        return issues
+
+    # Directory -> entry names, so links into the same directory share one
+    # listing instead of a stat each
+    dir_cache: dict[Path, set[str]] = {}
 
-    for match in re.finditer(link_pattern, body):
+    # Markdown links: [text](path); http/https URLs and anchors (#) are
+    # skipped below
+    for match in _LINK_RE.finditer(body):
         link_text, link_path = match.groups()
 
         # Skip URLs and anchors
@@ -535,8 +579,18 @@ def validate_referenced_files_exist(
 
         # Resolve relative path from skill directory
         referenced_path = skill_path / link_path
-
-        if not referenced_path.exists():
+        parent = referenced_path.parent
+
+        if parent not in dir_cache:
+            try:
+                with os.scandir(parent) as entries:
+                    dir_cache[parent] = {entry.name for entry in entries}
+            except OSError:
+                dir_cache[parent] = set()
+
+        # Names missing from the listing still get a stat, which catches
+        # case-insensitive filesystems
+        if referenced_path.name not in dir_cache[parent] and not referenced_path.exists():
             issues.append(ValidationIssue(
                 Severity.WARNING, file_path, "body",
                 f"Referenced file does not exist: '{link_path}'"
@@ -591,19 +645,18 @@ def suggest_description_optimization(
 
 def suggest_instruction_optimization(
     body: str,
+    body_lower: str,
     body_line_count: int,
     file_path: str
 ) -> list[ValidationIssue]:
-    """Suggest improvements for the instruction body."""
+    """Suggest improvements for the instruction body (body_lower is body.lower())."""
     issues = []
 
-    if not body.strip():
+    if not body or body.isspace():
         return issues
 
-    body_lower = body.lower()
-
     # Check for numbered workflow steps
-    has_numbered_steps = bool(re.search(r'^\s*[1-9]\.\s+', body, re.MULTILINE))
+    has_numbered_steps = bool(_NUMBERED_STEPS_RE.search(body))
     has_workflow_section = '## workflow' in body_lower or '# workflow' in body_lower
     if has_workflow_section and not has_numbered_steps:
         issues.append(ValidationIssue(
@@ -612,15 +665,8 @@ def suggest_instruction_optimization(
         ))
 
     # Check for obvious operation explanations
-    obvious_patterns = [
-        r'use the read tool',
-        r'use the write tool',
-        r'use the edit tool',
-        r'make sure the (?:file|path) exists',
-        r'check if the file exists',
-    ]
-    for pattern in obvious_patterns:
-        if re.search(pattern, body_lower):
+    for pattern, phrases in _OBVIOUS_PATTERNS:
+        if any(phrase in body_lower for phrase in phrases):
             issues.append(ValidationIssue(
                 Severity.SUGGESTION, file_path, "body",
                 f"Consider removing obvious operation explanations (found: '{pattern}'). Claude knows standard operations."
@@ -688,42 +734,27 @@ def suggest_gerund_naming(name: str | None, file_path: str) -> list[ValidationIs
     return issues
 
 
-def suggest_time_sensitive_language(body: str, file_path: str) -> list[ValidationIssue]:
+def suggest_time_sensitive_language(body_lower: str, file_path: str) -> list[ValidationIssue]:
     """
     Flag time-sensitive language that may become outdated.
 
+    Takes the lowercased body, shared with the other body suggestions.
+
     Rules:
     - Avoid "currently", "as of version X", "before August 2025", etc.
     - Skills should be timeless where possible
     """
     issues = []
 
-    if not body.strip():
+    if not body_lower or body_lower.isspace():
         return issues
 
-    # Patterns for time-sensitive language
-    patterns = [
-        (r'\bcurrently\b', "currently"),
-        (r'\brecently\b', "recently"),
-        (r'\bnow\b(?!\s+(?:you|we|it))', "now"),  # Avoid "now you can" false positives
-        (r'\bas of (?:version |v)?\d', "as of version X"),
-        (r'\bbefore \w+ \d{4}\b', "before [month] [year]"),
-        (r'\bafter \w+ \d{4}\b', "after [month] [year]"),
-        (r'\bin \d{4}\b', "in [year]"),
-        (r'\bsince \d{4}\b', "since [year]"),
-        (r'\bupcoming\b', "upcoming"),
-        (r'\bsoon\b', "soon"),
-        (r'\blatest\b', "latest"),
-        (r'\bnew(?:ly)?\b', "new/newly"),
+    found_groups = {m.lastgroup for m in _TIME_SENSITIVE_RE.finditer(body_lower)}
+    found_patterns = [
+        description for group, _, description in _TIME_SENSITIVE_PATTERNS
+        if group in found_groups
     ]
 
-    body_lower = body.lower()
-    found_patterns = []
-
-    for pattern, description in patterns:
-        if re.search(pattern, body_lower):
-            found_patterns.append(description)
-
     if found_patterns:
         examples = ', '.join(found_patterns[:3])
         issues.append(ValidationIssue(
@@ -734,6 +765,20 @@ def suggest_time_sensitive_language(body: str, file_path: str) -> list[Validatio
     return issues
 
 
+def _reference_md_files(references_dir: Path) -> list[os.DirEntry]:
+    """
+    List the *.md files directly in references/ (none if it is missing).
+
+    scandir's entries carry the file type from the directory listing, so
+    this costs no stat per entry.
+    """
+    try:
+        with os.scandir(references_dir) as entries:
+            return [entry for entry in entries if entry.name.endswith('.md') and entry.is_file()]
+    except OSError:
+        return []
+
+
 def suggest_toc_for_long_references(
     skill_path: Path,
     file_path: str
@@ -748,67 +793,52 @@ def suggest_toc_for_long_references(
     issues = []
 
     references_dir = skill_path / "references"
-    if not references_dir.exists():
-        return issues
 
-    for ref_file in references_dir.glob("*.md"):
+    for ref_file in _reference_md_files(references_dir):
         try:
-            content = ref_file.read_text()
+            # Over 100 lines takes at least 100 newlines, so at least 100
+            # bytes; smaller files are skipped without being opened
+            if ref_file.stat().st_size < 100:
+                continue
+            with open(ref_file.path) as f:
+                content = f.read()
             line_count = content.count('\n') + 1
 
-            if line_count > 100:
-                # Check for common TOC indicators
-                content_lower = content.lower()
-                has_toc = any(indicator in content_lower for indicator in [
-                    '## table of contents',
-                    '## contents',
-                    '## toc',
-                    '- [',  # Markdown link list (common TOC format)
-                ])
-
-                if not has_toc:
-                    rel_path = ref_file.relative_to(skill_path)
-                    issues.append(ValidationIssue(
-                        Severity.SUGGESTION, file_path, "references",
-                        f"Reference file '{rel_path}' has {line_count} lines. Consider adding a table of contents."
-                    ))
+            # One case-insensitive scan that stops at the first TOC indicator,
+            # instead of a lowercased copy searched once per indicator
+            if line_count > 100 and not _TOC_RE.search(content):
+                rel_path = Path("references", ref_file.name)
+                issues.append(ValidationIssue(
+                    Severity.SUGGESTION, file_path, "references",
+                    f"Reference file '{rel_path}' has {line_count} lines. Consider adding a table of contents."
+                ))
         except Exception:
             pass
 
     return issues
 
 
-def suggest_mcp_qualified_names(body: str, file_path: str) -> list[ValidationIssue]:
+def suggest_mcp_qualified_names(body_lower: str, file_path: str) -> list[ValidationIssue]:
     """
     Suggest using qualified names for MCP tools.
 
+    Takes the lowercased body, shared with the other body suggestions.
+
     Rules:
     - MCP tools should use server:tool format (e.g., "mcp__openrouter__chat")
     - Helps avoid ambiguity with multiple MCP servers
     """
     issues = []
 
-    if not body.strip():
+    if not body_lower or body_lower.isspace():
         return issues
 
-    # Common MCP tool patterns that might be unqualified
-    # Look for tool-like references without mcp__ prefix
-    unqualified_patterns = [
-        r'\bchat\s*\(\s*prompt',  # chat(prompt...) without mcp__ prefix
-        r'`chat`\s*tool',
-        r'the\s+chat\s+tool',
-        r'generate_image\s*\(',
-        r'`generate_image`',
-    ]
-
-    body_lower = body.lower()
-
     # Check if file mentions MCP but uses unqualified tool names
     mentions_mcp = 'mcp' in body_lower or 'openrouter' in body_lower
 
     if mentions_mcp:
-        for pattern in unqualified_patterns:
-            if re.search(pattern, body_lower):
+        for pattern_re in _UNQUALIFIED_MCP_PATTERNS:
+            if pattern_re.search(body_lower):
                 issues.append(ValidationIssue(
                     Severity.SUGGESTION, file_path, "body",
                     "When referencing MCP tools, use qualified names (e.g., 'mcp__openrouter__chat') to avoid ambiguity."
@@ -832,16 +862,18 @@ def suggest_no_deeply_nested_references(
     issues = []
 
     references_dir = skill_path / "references"
-    if not references_dir.exists():
-        return issues
-
-    link_pattern = r'\[([^\]]*)\]\(([^)]+\.md)\)'
 
-    for ref_file in references_dir.glob("*.md"):
+    for ref_file in _reference_md_files(references_dir):
         try:
-            content = ref_file.read_text()
+            with open(ref_file.path, 'rb') as f:
+                data = f.read()
+            # Every .md link ends in ".md)"; files without one skip the
+            # decode and the regex
+            if b'.md)' not in data:
+                continue
+            content = data.decode('utf-8')
 
-            for match in re.finditer(link_pattern, content):
+            for match in _MD_LINK_RE.finditer(content):
                 link_text, link_path = match.groups()
 
                 # Skip external URLs
@@ -852,9 +884,9 @@ def suggest_no_deeply_nested_references(
                 if 'references/' in link_path or link_path.endswith('.md'):
                     # Resolve to check if it's in references/
                     if not link_path.startswith('/'):
-                        resolved = (ref_file.parent / link_path).resolve()
+                        resolved = (references_dir / link_path).resolve()
                         if references_dir in resolved.parents or resolved.parent == references_dir:
-                            rel_path = ref_file.relative_to(skill_path)
+                            rel_path = Path("references", ref_file.name)
                             issues.append(ValidationIssue(
                                 Severity.SUGGESTION, file_path, "references",
                                 f"Reference '{rel_path}' links to another reference file. Consider flattening documentation structure."
@@ -898,6 +930,23 @@ def suggest_argument_hint(
     return issues
 
 
+@lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file; the mtime key makes an edited file parse again."""
+    with open(path, 'rb') as f:
+        return json.load(f)
+
+
+def _load_json(path: Path) -> Any:
+    """
+    Parse a JSON file at most once per run while it is unchanged.
+
+    plugin.json is read by two checks per skill and marketplace.json by every
+    skill in a batch. Callers share the returned object and must not mutate it.
+    """
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
 def validate_plugin_json(plugin_json_path: Path) -> list[ValidationIssue]:
     """
     Validate plugin.json schema.
@@ -915,8 +964,7 @@ def validate_plugin_json(plugin_json_path: Path) -> list[ValidationIssue]:
         return issues
 
     try:
-        with open(plugin_json_path) as f:
-            data = json.load(f)
+        data = _load_json(plugin_json_path)
     except json.JSONDecodeError as e:
         issues.append(ValidationIssue(
             Severity.ERROR, rel_path, "json",
@@ -956,34 +1004,38 @@ def validate_version_sync(
     skill_md_path: Path,
     plugin_json_path: Path,
     marketplace_path: Path | None,
-    plugin_name: str
+    plugin_name: str,
+    frontmatter: dict[str, Any] | None = None
 ) -> list[ValidationIssue]:
-    """Validate versions are synchronized across files."""
+    """
+    Validate versions are synchronized across files.
+
+    Pass the already parsed SKILL.md frontmatter to avoid reading it again.
+    """
     issues = []
     versions: dict[str, str | None] = {}
 
-    if skill_md_path.exists():
-        frontmatter, _, _ = parse_skill_md(skill_md_path)
+    if frontmatter is None and skill_md_path.exists():
+        frontmatter, _, _, _ = parse_skill_md(skill_md_path)
+    if frontmatter is not None:
         metadata = frontmatter.get('metadata', {})
         if isinstance(metadata, dict):
             versions['SKILL.md'] = metadata.get('version')
 
     if plugin_json_path.exists():
         try:
-            with open(plugin_json_path) as f:
-                data = json.load(f)
-                versions['plugin.json'] = data.get('version')
+            data = _load_json(plugin_json_path)
+            versions['plugin.json'] = data.get('version')
         except (json.JSONDecodeError, IOError):
             pass
 
     if marketplace_path and marketplace_path.exists():
         try:
-            with open(marketplace_path) as f:
-                data = json.load(f)
-                for plugin in data.get('plugins', []):
-                    if plugin.get('name') == plugin_name:
-                        versions['marketplace.json'] = plugin.get('version')
-                        break
+            data = _load_json(marketplace_path)
+            for plugin in data.get('plugins', []):
+                if plugin.get('name') == plugin_name:
+                    versions['marketplace.json'] = plugin.get('version')
+                    break
         except (json.JSONDecodeError, IOError):
             pass
 
@@ -1024,44 +1076,81 @@ def run_validation_hook(
     Returns:
         List of ValidationIssues from the hook (empty if no hook exists)
     """
+    proc = start_validation_hook(skill_path, suggest)
+    if proc is None:
+        return []
+    return finish_validation_hook(proc, timeout)
+
+
+def start_validation_hook(skill_path: Path, suggest: bool = False) -> "subprocess.Popen[str] | None":
+    """
+    Start the skill's validation hook in the background, if it has one.
+
+    validate_skill starts the hook before its own checks and collects it
+    with finish_validation_hook afterwards, so the two overlap.
+
+    Returns:
+        The running hook process (None if no hook exists)
+    """
     hook_path = skill_path / "scripts" / "validate_hook.py"
 
     if not hook_path.exists():
-        return []
+        return None
+
+    # Only needed for skills with a hook; keeps `import validate_skill` light
+    import subprocess
 
     # Build command
     cmd = [sys.executable, str(hook_path), str(skill_path)]
     if suggest:
         cmd.append("--suggest")
 
-    # Execute with timeout
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+
+def finish_validation_hook(
+    proc: "subprocess.Popen[str]",
+    timeout: int = 30
+) -> list[ValidationIssue]:
+    """
+    Wait for a hook started by start_validation_hook and convert its output.
+
+    The timeout counts from this call; a hook that exceeds it is killed.
+    """
+    import subprocess
+
+    hook_rel_path = str(Path("scripts", "validate_hook.py"))
+
+    # Wait with timeout
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+        stdout, stderr = proc.communicate(timeout=timeout)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
         return [ValidationIssue(
             Severity.WARNING,
-            str(hook_path.relative_to(skill_path)),
+            hook_rel_path,
             "hook",
             f"Validation hook timed out after {timeout}s"
         )]
 
-    if result.returncode != 0:
-        stderr_msg = result.stderr.strip() if result.stderr else "no error message"
+    if proc.returncode != 0:
+        stderr_msg = stderr.strip() if stderr else "no error message"
         return [ValidationIssue(
             Severity.ERROR,
-            str(hook_path.relative_to(skill_path)),
+            hook_rel_path,
             "hook",
-            f"Hook failed (exit {result.returncode}): {stderr_msg}"
+            f"Hook failed (exit {proc.returncode}): {stderr_msg}"
         )]
 
     # Parse JSON output
     try:
-        data = json.loads(result.stdout)
+        data = json.loads(stdout)
         return [
             ValidationIssue(
                 Severity[issue["severity"]],
@@ -1074,7 +1163,7 @@ def run_validation_hook(
     except (json.JSONDecodeError, KeyError, ValueError) as e:
         return [ValidationIssue(
             Severity.ERROR,
-            str(hook_path.relative_to(skill_path)),
+            hook_rel_path,
             "hook",
             f"Invalid hook output: {e}"
         )]
@@ -1148,7 +1237,7 @@ def validate_skill(skill_path: Path, suggest: bool = False) -> ValidationResult:
 
     # Parse SKILL.md
     try:
-        frontmatter, body, body_line_count = parse_skill_md(skill_md_path)
+        frontmatter, body, body_line_count, char_count = parse_skill_md(skill_md_path)
     except Exception as e:
         result.issues.append(ValidationIssue(
             Severity.ERROR, rel_path, "parse",
@@ -1156,73 +1245,89 @@ def validate_skill(skill_path: Path, suggest: bool = False) -> ValidationResult:
         ))
         return result
 
-    # Validate frontmatter
-    result.issues.extend(validate_name(
-        frontmatter.get('name'),
-        skill_name,
-        rel_path
-    ))
+    # Start the internal validation hook now so it runs alongside the checks
+    # below; it is collected in its usual place in the report
+    hook_proc = start_validation_hook(skill_path, suggest)
 
-    result.issues.extend(validate_description(
-        frontmatter.get('description'),
-        rel_path
-    ))
+    try:
+        # Validate frontmatter
+        result.issues.extend(validate_name(
+            frontmatter.get('name'),
+            skill_name,
+            rel_path
+        ))
 
-    result.issues.extend(validate_optional_fields(frontmatter, rel_path))
+        result.issues.extend(validate_description(
+            frontmatter.get('description'),
+            rel_path
+        ))
 
-    # Validate no XML tags in name/description
-    result.issues.extend(validate_no_xml_tags(
-        frontmatter.get('name'),
-        frontmatter.get('description'),
-        rel_path
-    ))
+        result.issues.extend(validate_optional_fields(frontmatter, rel_path))
 
-    # Validate vague names (WARNING level)
-    result.issues.extend(validate_vague_names(
-        frontmatter.get('name'),
-        rel_path
-    ))
+        # Validate no XML tags in name/description
+        result.issues.extend(validate_no_xml_tags(
+            frontmatter.get('name'),
+            frontmatter.get('description'),
+            rel_path
+        ))
 
-    # Validate body
-    result.issues.extend(validate_body(body_line_count, rel_path))
+        # Validate vague names (WARNING level)
+        result.issues.extend(validate_vague_names(
+            frontmatter.get('name'),
+            rel_path
+        ))
 
-    # Validate script paths use {SKILL_DIR} (WARNING level)
-    result.issues.extend(validate_script_paths_use_skill_dir(body, rel_path))
+        # Validate body
+        result.issues.extend(validate_body(body_line_count, rel_path))
 
-    # Validate no Windows-style paths (WARNING level)
-    result.issues.extend(validate_no_windows_paths(body, rel_path))
+        # Validate script paths use {SKILL_DIR} (WARNING level)
+        result.issues.extend(validate_script_paths_use_skill_dir(body, rel_path))
 
-    # Validate referenced files exist (WARNING level)
-    result.issues.extend(validate_referenced_files_exist(skill_path, body, rel_path))
+        # Validate no Windows-style paths (WARNING level)
+        result.issues.extend(validate_no_windows_paths(body, rel_path))
 
-    # Validate character budget
-    result.issues.extend(validate_character_budget(skill_md_path, rel_path))
+        # Validate referenced files exist (WARNING level)
+        result.issues.extend(validate_referenced_files_exist(skill_path, body, rel_path))
 
-    # Detect skill type and validate plugin-specific files
-    skill_type, plugin_json_path, marketplace_path = detect_skill_type(skill_path)
+        # Validate character budget
+        result.issues.extend(validate_character_budget(char_count, rel_path))
 
-    if skill_type == "plugin" and plugin_json_path:
-        result.issues.extend(validate_plugin_json(plugin_json_path))
+        # Detect skill type and validate plugin-specific files
+        skill_type, plugin_json_path, marketplace_path = detect_skill_type(skill_path)
 
-        plugin_name = plugin_json_path.parent.parent.name
-        result.issues.extend(validate_version_sync(
-            skill_md_path,
-            plugin_json_path,
-            marketplace_path,
-            plugin_name
-        ))
+        if skill_type == "plugin" and plugin_json_path:
+            result.issues.extend(validate_plugin_json(plugin_json_path))
 
-    # Run internal validation hook if present
-    result.issues.extend(run_validation_hook(skill_path, suggest))
+            plugin_name = plugin_json_path.parent.parent.name
+            result.issues.extend(validate_version_sync(
+                skill_md_path,
+                plugin_json_path,
+                marketplace_path,
+                plugin_name,
+                frontmatter
+            ))
+
+        # Collect the internal validation hook, if one was started
+        if hook_proc is not None:
+            result.issues.extend(finish_validation_hook(hook_proc))
+    finally:
+        # Only still running if a check raised before it was collected; kill
+        # it rather than leave an orphan writing into closed pipes
+        if hook_proc is not None and hook_proc.returncode is None:
+            hook_proc.kill()
+            hook_proc.communicate()
 
     # Add optimization suggestions if requested
     if suggest:
+        # Lowercased once for all the body suggestions
+        body_lower = body.lower()
         result.issues.extend(suggest_description_optimization(
             frontmatter.get('description'),
             rel_path
         ))
         result.issues.extend(suggest_instruction_optimization(
             body,
+            body_lower,
             body_line_count,
             rel_path
         ))
@@ -1231,7 +1336,7 @@ def validate_skill(skill_path: Path, suggest: bool = False) -> ValidationResult:
             rel_path
         ))
         result.issues.extend(suggest_time_sensitive_language(
-            body,
+            body_lower,
             rel_path
         ))
         result.issues.extend(suggest_toc_for_long_references(
@@ -1239,7 +1344,7 @@ def validate_skill(skill_path: Path, suggest: bool = False) -> ValidationResult:
             rel_path
         ))
         result.issues.extend(suggest_mcp_qualified_names(
-            body,
+            body_lower,
             rel_path
         ))
         result.issues.extend(suggest_no_deeply_nested_references(
@@ -1254,6 +1359,27 @@ def validate_skill(skill_path: Path, suggest: bool = False) -> ValidationResult:
     return result
 
 
+def validate_many(
+    skill_dirs: list[Path],
+    suggest: bool = False,
+    workers: int = DEFAULT_WORKERS
+) -> list[ValidationResult]:
+    """
+    Validate several skills, concurrently when there are enough of them.
+
+    Most of the time goes to file reads and validation hook subprocesses,
+    which release the GIL, so a thread pool is enough.
+
+    Returns:
+        Results in the same order as skill_dirs
+    """
+    if len(skill_dirs) < PARALLEL_THRESHOLD or workers <= 1:
+        return [validate_skill(path, suggest=suggest) for path in skill_dirs]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda path: validate_skill(path, suggest=suggest), skill_dirs))
+
+
 def print_result(result: ValidationResult, verbose: bool = False, suggest: bool = False) -> None:
     """Print validation result to stdout."""
     for issue in result.issues:
@@ -1262,9 +1388,10 @@ def print_result(result: ValidationResult, verbose: bool = False, suggest: bool
     if result.issues:
         print()
 
-    error_count = sum(1 for i in result.issues if i.severity == Severity.ERROR)
-    warning_count = sum(1 for i in result.issues if i.severity == Severity.WARNING)
-    suggestion_count = sum(1 for i in result.issues if i.severity == Severity.SUGGESTION)
+    counts = Counter(i.severity for i in result.issues)
+    error_count = counts[Severity.ERROR]
+    warning_count = counts[Severity.WARNING]
+    suggestion_count = counts[Severity.SUGGESTION]
 
     print(f"Skill: {result.skill_name}")
     print(f"  Path: {result.skill_path}")
@@ -1285,13 +1412,16 @@ def print_result(result: ValidationResult, verbose: bool = False, suggest: bool
 # =============================================================================
 
 def main() -> int:
+    import argparse
+
     parser = argparse.ArgumentParser(
-        description="Validate a single skill against Agent Skills specification"
+        description="Validate skills against Agent Skills specification"
     )
     parser.add_argument(
         "skill_path",
         type=str,
-        help="Path to skill directory (e.g., plugins/my-skill/skills/my-skill/)"
+        nargs="+",
+        help="Path to skill directory (e.g., plugins/my-skill/skills/my-skill/); several may be given"
     )
     parser.add_argument(
         "--verbose", "-v",
@@ -1303,23 +1433,33 @@ def main() -> int:
         action="store_true",
         help="Include optimization suggestions beyond errors and warnings"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Skills to validate concurrently when given several (default: {DEFAULT_WORKERS})"
+    )
 
     args = parser.parse_args()
 
-    skill_path = Path(args.skill_path).resolve()
+    skill_paths = [Path(path).resolve() for path in args.skill_path]
 
-    if not skill_path.exists():
-        print(f"ERROR: Path does not exist: {skill_path}", file=sys.stderr)
-        return 1
+    for skill_path in skill_paths:
+        if not skill_path.exists():
+            print(f"ERROR: Path does not exist: {skill_path}", file=sys.stderr)
+            return 1
 
-    if not skill_path.is_dir():
-        print(f"ERROR: Path is not a directory: {skill_path}", file=sys.stderr)
-        return 1
+        if not skill_path.is_dir():
+            print(f"ERROR: Path is not a directory: {skill_path}", file=sys.stderr)
+            return 1
 
-    result = validate_skill(skill_path, suggest=args.suggest)
-    print_result(result, verbose=args.verbose, suggest=args.suggest)
+    results = validate_many(skill_paths, suggest=args.suggest, workers=args.workers)
+    for i, result in enumerate(results):
+        if i:
+            print()
+        print_result(result, verbose=args.verbose, suggest=args.suggest)
 
-    return 0 if result.passed else 1
+    return 0 if all(result.passed for result in results) else 1
 
 
 if __name__ == "__main__":
@@ -16,8 +16,13 @@ import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Callable
 
 # Ensure script directory is in path for local imports
 SCRIPT_DIR = Path(__file__).parent
@@ -25,10 +30,163 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 # Import local utilities (bundled with plugin for portability)
 from pii_scanner import scan_repo as pii_scan_repo
-from extract_tagline import extract_tagline
-from repo_utils import find_repos
+from extract_tagline import extract_tagline_from_text
+from repo_utils import find_repos, get_gh_token
+
+# External tools, resolved once (they don't appear or disappear mid-run)
+_GIT_PATH = shutil.which("git")
+_GH_PATH = shutil.which("gh")
+_UV_PATH = shutil.which("uv")
+
+# Matches both git@github.com:user/repo.git and https://github.com/user/repo.git
+_GITHUB_REMOTE = re.compile(r"github\.com[:/]([^/\s]+)/")
+
+# Body of the [remote "origin"] section in .git/config
+_ORIGIN_SECTION = re.compile(r'^\[remote "origin"\]\s*$(.*?)(?=^\[|\Z)', re.MULTILINE | re.DOTALL)
+
+# README staleness markers (placeholders reported with their original casing)
+README_PLACEHOLDERS = [
+    "TODO",
+    "FIXME",
+    "Coming soon",
+    "Work in progress",
+    "Under construction",
+    "[Insert",
+    "Lorem ipsum",
+]
+README_INSTALL_KEYWORDS = ("install", "setup", "getting started")
+README_USAGE_KEYWORDS = ("usage", "example", "how to")
+
+# Files larger than this are skipped by the PII scan (generated/data files)
+PII_MAX_FILE_BYTES = 1_048_576
+# Vendored code and binary data the audit doesn't own; the standalone scanner still covers them
+PII_EXTRA_SKIP_DIRS = ("vendor", "third_party")
+PII_EXTRA_SKIP_EXTENSIONS = (".whl", ".parquet")
+
+# Directories never worth walking when looking for source files
+SOURCE_WALK_SKIP_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", "dist", "build"}
+
+# License heading or MIT mention, matched case-insensitively in one pass
+_README_LICENSE = re.compile(r"^\s*#{1,6}\s*license|mit license|\[mit\]", re.IGNORECASE | re.MULTILINE)
+
+
+@dataclass
+class RepoContext:
+    """Per-repo state shared by all checks so files are read at most once."""
+
+    path: Path
+    root: str = field(init=False, repr=False)
+    _readme: str | None = field(default=None, repr=False)
+    _readme_lower: str | None = field(default=None, repr=False)
+    # subdir -> (entry names, symlink names), published together so checks
+    # running on other threads never see one without the other
+    _listings: dict[str, tuple[frozenset[str], frozenset[str]]] = field(default_factory=dict, repr=False)
+    _files: frozenset[str] | None = field(default=None, repr=False)
+    _files_listed: bool = field(default=False, repr=False)
+
+    def __post_init__(self):
+        # Checks compose paths as plain strings; Path stays at the API boundary
+        self.root = str(self.path)
+
+    def join(self, relpath: str) -> str:
+        """Return the absolute path string for a repo-relative path."""
+        return os.path.join(self.root, relpath)
+
+    def read_text(self, relpath: str) -> str:
+        """Read a repo-relative file as UTF-8, ignoring decode errors."""
+        with open(self.join(relpath), encoding="utf-8", errors="ignore") as f:
+            return f.read()
+
+    def _listing(self, subdir: str) -> tuple[frozenset[str], frozenset[str]]:
+        """Return (entry names, symlink names) for a directory, listed once."""
+        listing = self._listings.get(subdir)
+        if listing is None:
+            try:
+                with os.scandir(self.join(subdir) if subdir else self.root) as it:
+                    entries = list(it)
+            except OSError:
+                entries = []
+            # d_type answers is_symlink() without a stat
+            listing = (
+                frozenset(entry.name for entry in entries),
+                frozenset(entry.name for entry in entries if entry.is_symlink()),
+            )
+            self._listings[subdir] = listing
+        return listing
+
+    def names(self, subdir: str = "") -> frozenset[str]:
+        """Return entry names in the repo root (or a subdirectory), listed once."""
+        return self._listing(subdir)[0]
+
+    def has(self, relpath: str) -> bool:
+        """Check whether a repo-relative path exists, like os.path.exists.
+
+        Names in the cached listing answer without a stat, except symlinks,
+        which are followed so broken ones don't count. Names missing from
+        the listing still get a stat, which catches case-insensitive
+        filesystems (e.g. Readme.md for README.md on macOS).
+        """
+        parent, _, name = relpath.rpartition("/")
+        if parent and not self.has(parent):
+            return False
+        names, symlinks = self._listing(parent)
+        if name in names and name not in symlinks:
+            return True
+        return os.path.exists(self.join(relpath))
+
+    def files(self) -> frozenset[str] | None:
+        """Return repo-relative paths of all non-ignored files, via git.
+
+        One `git ls-files` call applies .gitignore natively; the result is
+        shared by the logo, Python and PII checks. Index entries deleted from
+        the worktree are left out, so the list only names files that exist.
+        Returns None when git cannot list the repo, so callers fall back to
+        walking the tree.
+        """
+        if not self._files_listed:
+            self._files_listed = True
+            try:
+                # -t prefixes each path with a status tag: "R " marks a
+                # deleted index entry (listed again, as "H ", by --cached).
+                # "S " (skip-worktree) files often still exist, e.g. local
+                # config holding secrets, so only missing ones are dropped
+                result = subprocess.run(
+                    [_GIT_PATH or "git", "-C", self.root, "ls-files", "-z", "-t",
+                     "--cached", "--deleted", "--others", "--exclude-standard"],
+                    capture_output=True,
+                    timeout=30,
+                )
+                if result.returncode == 0:
+                    entries = [entry for entry in result.stdout.split(b"\0") if entry]
+                    absent = {
+                        entry[2:] for entry in entries
+                        if entry[:2] == b"R "
+                        or (entry[:2] == b"S " and not os.path.lexists(os.path.join(self.root, os.fsdecode(entry[2:]))))
+                    }
+                    self._files = frozenset(
+                        os.fsdecode(entry[2:]) for entry in entries if entry[2:] not in absent
+                    )
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        return self._files
+
+    def readme(self) -> str:
+        """Return README.md content, reading it on first access.
 
+        Raises OSError if the file cannot be read (nothing is cached then).
+        """
+        if self._readme is None:
+            self._readme = self.read_text("README.md")
+        return self._readme
 
+    def readme_lower(self) -> str:
+        """Return lowercased README.md content, computed once."""
+        if self._readme_lower is None:
+            self._readme_lower = self.readme().lower()
+        return self._readme_lower
+
+
+@lru_cache(maxsize=None)
 def check_dependencies() -> dict:
     """Check required external dependencies."""
     results = {
@@ -37,51 +195,52 @@ def check_dependencies() -> dict:
     }
 
     # Check git
-    if shutil.which("git"):
+    if _GIT_PATH:
         results["git"]["available"] = True
     else:
         results["git"]["error"] = "git not found in PATH"
 
-    # Check gh CLI
-    if shutil.which("gh"):
-        try:
-            result = subprocess.run(
-                ["gh", "auth", "status"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                results["gh"]["available"] = True
-            else:
-                results["gh"]["available"] = True  # gh exists but may not be authed
-                results["gh"]["error"] = "gh CLI not authenticated (run: gh auth login)"
-        except subprocess.TimeoutExpired:
-            results["gh"]["error"] = "gh auth status timed out"
-        except Exception as e:
-            results["gh"]["error"] = str(e)
+    # Check gh CLI (authenticated if it has a token, cached across scripts)
+    if _GH_PATH:
+        results["gh"]["available"] = True  # gh exists but may not be authed
+        if not get_gh_token():
+            results["gh"]["error"] = "gh CLI not authenticated (run: gh auth login)"
     else:
         results["gh"]["error"] = "gh CLI not found in PATH (install: brew install gh)"
 
     return results
 
 
+@lru_cache(maxsize=None)
 def detect_github_user(repos_dir: Path) -> str | None:
-    """Detect GitHub username from git remote origin of any repo."""
+    """Detect GitHub username from git remote origin of any repo.
+
+    Reads the origin URL straight from .git/config; only spawns git when the
+    config can't be read (e.g. worktrees, where .git is a file).
+    """
     for repo_path in find_repos(repos_dir):
+        try:
+            config = (repo_path / ".git" / "config").read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            config = None
+
+        if config is not None:
+            section = _ORIGIN_SECTION.search(config)
+            match = _GITHUB_REMOTE.search(section.group(1)) if section else None
+            if match:
+                return match.group(1)
+            continue
+
         try:
             result = subprocess.run(
-                ["git", "-C", str(repo_path), "remote", "get-url", "origin"],
+                [_GIT_PATH or "git", "-C", str(repo_path), "remote", "get-url", "origin"],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
             if result.returncode == 0:
                 url = result.stdout.strip()
-                # Parse GitHub URL formats:
-                # git@github.com:user/repo.git
-                # https://github.com/user/repo.git
-                match = re.search(r"github\.com[:/]([^/]+)/", url)
+                match = _GITHUB_REMOTE.search(url)
                 if match:
                     return match.group(1)
         except Exception:
@@ -89,20 +248,19 @@ def detect_github_user(repos_dir: Path) -> str | None:
     return None
 
 
-def check_readme_exists(repo_path: Path) -> dict:
+def check_readme_exists(ctx: RepoContext) -> dict:
     """Check if README.md exists."""
-    readme_path = repo_path / "README.md"
-    exists = readme_path.exists()
+    exists = ctx.has("README.md")
     return {
         "check": "README_EXISTS",
         "passed": exists,
-        "path": str(readme_path) if exists else None,
+        "path": ctx.join("README.md") if exists else None,
         "message": "README.md exists" if exists else "README.md not found",
         "auto_fix": "project-readme-author create",
     }
 
 
-def check_readme_current(repo_path: Path) -> dict:
+def check_readme_current(ctx: RepoContext) -> dict:
     """
     Check if README appears to be current using staleness heuristics.
 
@@ -111,9 +269,7 @@ def check_readme_current(repo_path: Path) -> dict:
     - Contains common outdated markers
     - Has broken badge URLs
     """
-    readme_path = repo_path / "README.md"
-
-    if not readme_path.exists():
+    if not ctx.has("README.md"):
         return {
             "check": "README_CURRENT",
             "passed": False,
@@ -124,20 +280,14 @@ def check_readme_current(repo_path: Path) -> dict:
     issues = []
 
     try:
-        content = readme_path.read_text(encoding="utf-8", errors="ignore")
+        content = ctx.readme()
+        # Lowercased once per repo; substring checks are memchr-fast and
+        # beat a regex scan for this handful of literals
+        content_lower = ctx.readme_lower()
 
         # Check for placeholder content
-        placeholders = [
-            "TODO",
-            "FIXME",
-            "Coming soon",
-            "Work in progress",
-            "Under construction",
-            "[Insert",
-            "Lorem ipsum",
-        ]
-        for placeholder in placeholders:
-            if placeholder.lower() in content.lower():
+        for placeholder in README_PLACEHOLDERS:
+            if placeholder.lower() in content_lower:
                 issues.append(f"Contains placeholder: '{placeholder}'")
 
         # Check for very short README
@@ -145,8 +295,8 @@ def check_readme_current(repo_path: Path) -> dict:
             issues.append("README is very short (<100 chars)")
 
         # Check for missing sections
-        has_installation = any(x in content.lower() for x in ["install", "setup", "getting started"])
-        has_usage = any(x in content.lower() for x in ["usage", "example", "how to"])
+        has_installation = any(x in content_lower for x in README_INSTALL_KEYWORDS)
+        has_usage = any(x in content_lower for x in README_USAGE_KEYWORDS)
 
         if not has_installation and not has_usage:
             issues.append("Missing installation/usage sections")
@@ -163,7 +313,7 @@ def check_readme_current(repo_path: Path) -> dict:
     }
 
 
-def check_logo_exists(repo_path: Path) -> dict:
+def check_logo_exists(ctx: RepoContext) -> dict:
     """Check if logo exists in standard locations."""
     logo_patterns = [
         "logo.png", "logo.svg", "logo.jpg",
@@ -172,13 +322,14 @@ def check_logo_exists(repo_path: Path) -> dict:
         ".github/logo.png", ".github/logo.svg",
     ]
 
+    files = ctx.files()
     for pattern in logo_patterns:
-        logo_path = repo_path / pattern
-        if logo_path.exists():
+        found = pattern in files if files is not None else ctx.has(pattern)
+        if found:
             return {
                 "check": "LOGO_EXISTS",
                 "passed": True,
-                "path": str(logo_path),
+                "path": ctx.join(pattern),
                 "message": f"Logo found at {pattern}",
             }
 
@@ -191,22 +342,28 @@ def check_logo_exists(repo_path: Path) -> dict:
     }
 
 
-def check_gitignore_exists(repo_path: Path) -> dict:
+def check_gitignore_exists(ctx: RepoContext) -> dict:
     """Check if .gitignore exists."""
-    gitignore_path = repo_path / ".gitignore"
-    exists = gitignore_path.exists()
+    exists = ctx.has(".gitignore")
     return {
         "check": "GITIGNORE_EXISTS",
         "passed": exists,
-        "path": str(gitignore_path) if exists else None,
+        "path": ctx.join(".gitignore") if exists else None,
         "message": ".gitignore exists" if exists else ".gitignore not found",
         "auto_fix": "create from template",
     }
 
 
-def check_gitignore_complete(repo_path: Path) -> dict:
+def _gitignore_base(pattern: str) -> str:
+    """Normalize a gitignore entry: drop anchors, trailing slash/star, and case."""
+    base = pattern.strip().lower().rstrip("/").rstrip("*")
+    if base.startswith("**/"):
+        base = base[3:]
+    return base.lstrip("/")
+
+
+def check_gitignore_complete(ctx: RepoContext) -> dict:
     """Check if .gitignore contains essential patterns."""
-    gitignore_path = repo_path / ".gitignore"
 
     # Essential patterns that should be in most gitignores
     essential_patterns = [
@@ -220,7 +377,7 @@ def check_gitignore_complete(repo_path: Path) -> dict:
         ".claude-sandbox.json",
     ]
 
-    if not gitignore_path.exists():
+    if not ctx.has(".gitignore"):
         return {
             "check": "GITIGNORE_COMPLETE",
             "passed": False,
@@ -230,15 +387,15 @@ def check_gitignore_complete(repo_path: Path) -> dict:
         }
 
     try:
-        content = gitignore_path.read_text(encoding="utf-8", errors="ignore")
-        content_lower = content.lower()
+        content = ctx.read_text(".gitignore")
 
-        missing = []
-        for pattern in essential_patterns:
-            # Simple check - pattern or its base should be present
-            pattern_base = pattern.rstrip("/").rstrip("*").lower()
-            if pattern_base not in content_lower:
-                missing.append(pattern)
+        # Tokenize once: each non-comment line reduced to its pattern base
+        present = {
+            _gitignore_base(line)
+            for line in content.splitlines()
+            if line.strip() and not line.strip().startswith("#")
+        }
+        missing = [p for p in essential_patterns if _gitignore_base(p) not in present]
 
         return {
             "check": "GITIGNORE_COMPLETE",
@@ -256,24 +413,21 @@ def check_gitignore_complete(repo_path: Path) -> dict:
         }
 
 
-def check_claude_md_exists(repo_path: Path) -> dict:
+def check_claude_md_exists(ctx: RepoContext) -> dict:
     """Check if CLAUDE.md exists."""
-    claude_md_path = repo_path / "CLAUDE.md"
-    exists = claude_md_path.exists()
+    exists = ctx.has("CLAUDE.md")
     return {
         "check": "CLAUDE_MD_EXISTS",
         "passed": exists,
-        "path": str(claude_md_path) if exists else None,
+        "path": ctx.join("CLAUDE.md") if exists else None,
         "message": "CLAUDE.md exists" if exists else "CLAUDE.md not found",
         "auto_fix": "/init",
     }
 
 
-def check_description_synced(repo_path: Path) -> dict:
+def check_description_synced(ctx: RepoContext) -> dict:
     """Check if GitHub description matches README tagline."""
-    readme_path = repo_path / "README.md"
-
-    if not readme_path.exists():
+    if not ctx.has("README.md"):
         return {
             "check": "DESCRIPTION_SYNCED",
             "passed": False,
@@ -282,16 +436,16 @@ def check_description_synced(repo_path: Path) -> dict:
         }
 
     # Get repo name
-    repo_name = repo_path.name
+    repo_name = ctx.path.name
 
     # Try to get GitHub description
     try:
         result = subprocess.run(
-            ["gh", "repo", "view", repo_name, "--json", "description"],
+            [_GH_PATH or "gh", "repo", "view", repo_name, "--json", "description"],
             capture_output=True,
             text=True,
             timeout=10,
-            cwd=str(repo_path),
+            cwd=ctx.root,
         )
 
         if result.returncode != 0:
@@ -314,7 +468,10 @@ def check_description_synced(repo_path: Path) -> dict:
         }
 
     # Extract tagline from README using robust extraction
-    readme_tagline = extract_tagline(readme_path)
+    try:
+        readme_tagline = extract_tagline_from_text(ctx.readme())
+    except OSError:
+        readme_tagline = None
 
     if not readme_tagline:
         return {
@@ -338,10 +495,17 @@ def check_description_synced(repo_path: Path) -> dict:
     }
 
 
-def check_pii_clean(repo_path: Path) -> dict:
+def check_pii_clean(ctx: RepoContext) -> dict:
     """Check for PII/credentials using pii_scanner."""
     try:
-        results = pii_scan_repo(repo_path, respect_gitignore=True)
+        results = pii_scan_repo(
+            ctx.path,
+            respect_gitignore=True,
+            files=ctx.files(),
+            max_bytes=PII_MAX_FILE_BYTES,
+            extra_skip_dirs=PII_EXTRA_SKIP_DIRS,
+            extra_skip_extensions=PII_EXTRA_SKIP_EXTENSIONS,
+        )
 
         if "error" in results:
             return {
@@ -373,15 +537,14 @@ def check_pii_clean(repo_path: Path) -> dict:
         }
 
 
-def check_license_exists(repo_path: Path) -> dict:
+def check_license_exists(ctx: RepoContext) -> dict:
     """Check if LICENSE file exists."""
     for name in ["LICENSE", "LICENSE.md", "LICENSE.txt"]:
-        license_path = repo_path / name
-        if license_path.exists():
+        if ctx.has(name):
             return {
                 "check": "LICENSE_EXISTS",
                 "passed": True,
-                "path": str(license_path),
+                "path": ctx.join(name),
                 "message": f"License found at {name}",
             }
     return {
@@ -393,11 +556,9 @@ def check_license_exists(repo_path: Path) -> dict:
     }
 
 
-def check_readme_has_license(repo_path: Path) -> dict:
+def check_readme_has_license(ctx: RepoContext) -> dict:
     """Check if README references license."""
-    readme_path = repo_path / "README.md"
-
-    if not readme_path.exists():
+    if not ctx.has("README.md"):
         return {
             "check": "README_HAS_LICENSE",
             "passed": False,
@@ -406,16 +567,8 @@ def check_readme_has_license(repo_path: Path) -> dict:
         }
 
     try:
-        content = readme_path.read_text(encoding="utf-8", errors="ignore")
-        content_lower = content.lower()
-
         # Check for license section or MIT mention
-        has_license = (
-            "## license" in content_lower or
-            "# license" in content_lower or
-            "mit license" in content_lower or
-            "[mit]" in content_lower
-        )
+        has_license = _README_LICENSE.search(ctx.readme()) is not None
 
         return {
             "check": "README_HAS_LICENSE",
@@ -432,12 +585,11 @@ def check_readme_has_license(repo_path: Path) -> dict:
         }
 
 
-def check_claude_settings_sandbox(repo_path: Path) -> dict:
+def check_claude_settings_sandbox(ctx: RepoContext) -> dict:
     """Check if repo has Claude settings with sandbox.enabled = true."""
-    claude_dir = repo_path / ".claude"
     settings_files = [
-        claude_dir / "settings.json",
-        claude_dir / "settings.local.json",
+        ".claude/settings.json",
+        ".claude/settings.local.json",
     ]
 
     sandbox_enabled = False
@@ -445,10 +597,10 @@ def check_claude_settings_sandbox(repo_path: Path) -> dict:
 
     # Check settings files for sandbox.enabled = true
     for settings_file in settings_files:
-        if settings_file.exists():
+        if ctx.has(settings_file):
             has_settings_file = True
             try:
-                content = settings_file.read_text(encoding="utf-8", errors="ignore")
+                content = ctx.read_text(settings_file)
                 data = json.loads(content)
                 # Check if sandbox.enabled is explicitly true
                 if isinstance(data.get("sandbox"), dict) and data["sandbox"].get("enabled") is True:
@@ -467,23 +619,70 @@ def check_claude_settings_sandbox(repo_path: Path) -> dict:
     }
 
 
-def check_python_pyproject(repo_path: Path) -> dict:
+def _is_python_source(relpath: str, max_depth: int = 2) -> bool:
+    """Whether a repo-relative path counts towards Python detection.
+
+    The same rule _has_python_sources walks by: a non-test .py file at most
+    `max_depth` directories deep, outside SOURCE_WALK_SKIP_DIRS.
+    """
+    if not relpath.endswith(".py"):
+        return False
+    *dirs, name = relpath.split("/")
+    return (
+        not name.startswith("test_")
+        and len(dirs) <= max_depth
+        and SOURCE_WALK_SKIP_DIRS.isdisjoint(dirs)
+    )
+
+
+def _has_python_sources(root: str, threshold: int = 3, max_depth: int = 2) -> bool:
+    """Return True once `threshold` non-test .py files are found under root.
+
+    Walks with os.scandir down to `max_depth` levels below root and prunes
+    SOURCE_WALK_SKIP_DIRS, stopping at the first `threshold` matches instead
+    of enumerating the whole tree.
+    """
+    count = 0
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < max_depth and entry.name not in SOURCE_WALK_SKIP_DIRS:
+                            stack.append((entry.path, depth + 1))
+                    elif entry.name.endswith(".py") and not entry.name.startswith("test_"):
+                        count += 1
+                        if count >= threshold:
+                            return True
+        except OSError:
+            continue
+    return False
+
+
+def check_python_pyproject(ctx: RepoContext) -> dict:
     """Check if Python project has pyproject.toml."""
     # Detect if it's a Python project
     python_indicators = [
-        repo_path / "setup.py",
-        repo_path / "requirements.txt",
-        repo_path / "setup.cfg",
-        repo_path / "Pipfile",
+        "setup.py",
+        "requirements.txt",
+        "setup.cfg",
+        "Pipfile",
+        "pyproject.toml",
     ]
 
-    is_python = any(f.exists() for f in python_indicators)
+    is_python = any(ctx.has(f) for f in python_indicators)
 
-    # Also check for .py files
-    if not is_python:
-        py_files = list(repo_path.glob("*.py")) + list(repo_path.glob("**/*.py"))
-        # Filter out test files and common non-package files
-        is_python = len([f for f in py_files if not f.name.startswith("test_")]) > 2
+    # Without markers, only look deeper for .py files when the top level has some
+    if not is_python and any(name.endswith(".py") for name in ctx.names()):
+        files = ctx.files()
+        if files is None:
+            is_python = _has_python_sources(ctx.root)
+        else:
+            # Stop at the third match instead of classifying every file
+            matches = (f for f in files if _is_python_source(f))
+            is_python = next(islice(matches, 2, None), None) is not None
 
     if not is_python:
         return {
@@ -493,23 +692,20 @@ def check_python_pyproject(repo_path: Path) -> dict:
             "skipped": True,
         }
 
-    pyproject_path = repo_path / "pyproject.toml"
-    exists = pyproject_path.exists()
+    exists = ctx.has("pyproject.toml")
 
     return {
         "check": "PYTHON_PYPROJECT",
         "passed": exists,
-        "path": str(pyproject_path) if exists else None,
+        "path": ctx.join("pyproject.toml") if exists else None,
         "message": "pyproject.toml exists" if exists else "Python project missing pyproject.toml",
         "auto_fix": "generate pyproject.toml",
     }
 
 
-def check_python_uv_install(repo_path: Path) -> dict:
+def check_python_uv_install(ctx: RepoContext) -> dict:
     """Check if Python project can be installed with uv."""
-    pyproject_path = repo_path / "pyproject.toml"
-
-    if not pyproject_path.exists():
+    if not ctx.has("pyproject.toml"):
         return {
             "check": "PYTHON_UV_INSTALL",
             "passed": False,
@@ -520,11 +716,11 @@ def check_python_uv_install(repo_path: Path) -> dict:
     # Try uv sync --dry-run
     try:
         result = subprocess.run(
-            ["uv", "sync", "--dry-run"],
+            [_UV_PATH or "uv", "sync", "--dry-run"],
             capture_output=True,
             text=True,
             timeout=30,
-            cwd=str(repo_path),
+            cwd=ctx.root,
         )
 
         if result.returncode == 0:
@@ -564,45 +760,41 @@ def check_python_uv_install(repo_path: Path) -> dict:
         }
 
 
-def check_dependabot_exists(repo_path: Path) -> dict:
+def check_dependabot_exists(ctx: RepoContext) -> dict:
     """Check if .github/dependabot.yml exists for automated dependency updates."""
-    dependabot_path = repo_path / ".github" / "dependabot.yml"
-    alt_path = repo_path / ".github" / "dependabot.yaml"
-
-    if dependabot_path.exists():
+    if ctx.has(".github/dependabot.yml"):
         return {
             "check": "DEPENDABOT_EXISTS",
             "passed": True,
-            "path": str(dependabot_path),
+            "path": ctx.join(".github/dependabot.yml"),
             "message": "Dependabot config exists",
         }
 
-    if alt_path.exists():
+    if ctx.has(".github/dependabot.yaml"):
         return {
             "check": "DEPENDABOT_EXISTS",
             "passed": True,
-            "path": str(alt_path),
+            "path": ctx.join(".github/dependabot.yaml"),
             "message": "Dependabot config exists (yaml extension)",
         }
 
     # Detect which ecosystems would be relevant for this repo
     ecosystems = []
-    if (repo_path / ".github").exists():
+    if ctx.has(".github/workflows"):
         # Check for workflow files
-        workflows = list((repo_path / ".github" / "workflows").glob("*.yml")) if (repo_path / ".github" / "workflows").exists() else []
-        if workflows:
+        if any(name.endswith(".yml") for name in ctx.names(".github/workflows")):
             ecosystems.append("github-actions")
-    if (repo_path / "package.json").exists():
+    if ctx.has("package.json"):
         ecosystems.append("npm")
-    if (repo_path / "pyproject.toml").exists() or (repo_path / "requirements.txt").exists():
+    if ctx.has("pyproject.toml") or ctx.has("requirements.txt"):
         ecosystems.append("pip")
-    if (repo_path / "Cargo.toml").exists():
+    if ctx.has("Cargo.toml"):
         ecosystems.append("cargo")
-    if (repo_path / "go.mod").exists():
+    if ctx.has("go.mod"):
         ecosystems.append("gomod")
-    if (repo_path / "Gemfile").exists():
+    if ctx.has("Gemfile"):
         ecosystems.append("bundler")
-    if (repo_path / "composer.json").exists():
+    if ctx.has("composer.json"):
         ecosystems.append("composer")
 
     return {
@@ -615,25 +807,74 @@ def check_dependabot_exists(repo_path: Path) -> dict:
     }
 
 
-def audit_repo(repo_path: Path) -> dict:
-    """Run all checks on a single repository."""
+# All checks, in report order
+CHECKS = [
+    ("README_EXISTS", check_readme_exists),
+    ("README_CURRENT", check_readme_current),
+    ("README_HAS_LICENSE", check_readme_has_license),
+    ("LOGO_EXISTS", check_logo_exists),
+    ("LICENSE_EXISTS", check_license_exists),
+    ("GITIGNORE_EXISTS", check_gitignore_exists),
+    ("GITIGNORE_COMPLETE", check_gitignore_complete),
+    ("CLAUDE_MD_EXISTS", check_claude_md_exists),
+    ("CLAUDE_SETTINGS_SANDBOX", check_claude_settings_sandbox),
+    ("DEPENDABOT_EXISTS", check_dependabot_exists),
+    ("DESCRIPTION_SYNCED", check_description_synced),
+    ("PII_CLEAN", check_pii_clean),
+    ("PYTHON_PYPROJECT", check_python_pyproject),
+    ("PYTHON_UV_INSTALL", check_python_uv_install),
+]
+
+# Checks that mostly wait on external processes (gh network call, uv resolve)
+SUBPROCESS_CHECKS = ("DESCRIPTION_SYNCED", "PYTHON_UV_INSTALL")
+
+# Short names accepted by --skip for the slowest checks
+SKIP_ALIASES = {
+    "gh": "DESCRIPTION_SYNCED",
+    "pii": "PII_CLEAN",
+    "uv": "PYTHON_UV_INSTALL",
+}
+
+
+def parse_skip(value: str) -> frozenset[str]:
+    """Parse a comma-separated --skip value into check IDs.
+
+    Raises ValueError for names that are neither check IDs nor aliases.
+    """
+    known = {check_id for check_id, _ in CHECKS}
+    skip = set()
+    for name in filter(None, (part.strip() for part in value.split(","))):
+        check_id = SKIP_ALIASES.get(name.lower(), name.upper())
+        if check_id not in known:
+            raise ValueError(f"Unknown check: {name}")
+        skip.add(check_id)
+    return frozenset(skip)
+
+
+def audit_repo(repo_path: Path, skip: frozenset[str] = frozenset()) -> dict:
+    """Run all checks on a single repository, stubbing out skipped check IDs."""
     repo_path = Path(repo_path).resolve()
+    ctx = RepoContext(repo_path)
+    to_run = [(check_id, fn) for check_id, fn in CHECKS if check_id not in skip]
+
+    # Start subprocess-bound checks first so they overlap the local ones
+    with ThreadPoolExecutor(max_workers=len(SUBPROCESS_CHECKS)) as executor:
+        futures = {
+            check_id: executor.submit(fn, ctx)
+            for check_id, fn in to_run
+            if check_id in SUBPROCESS_CHECKS
+        }
+        results = {check_id: fn(ctx) for check_id, fn in to_run if check_id not in futures}
+        results.update({check_id: future.result() for check_id, future in futures.items()})
 
     checks = [
-        check_readme_exists(repo_path),
-        check_readme_current(repo_path),
-        check_readme_has_license(repo_path),
-        check_logo_exists(repo_path),
-        check_license_exists(repo_path),
-        check_gitignore_exists(repo_path),
-        check_gitignore_complete(repo_path),
-        check_claude_md_exists(repo_path),
-        check_claude_settings_sandbox(repo_path),
-        check_dependabot_exists(repo_path),
-        check_description_synced(repo_path),
-        check_pii_clean(repo_path),
-        check_python_pyproject(repo_path),
-        check_python_uv_install(repo_path),
+        results.get(check_id) or {
+            "check": check_id,
+            "passed": False,
+            "message": "Skipped (--skip)",
+            "skipped": True,
+        }
+        for check_id, _ in CHECKS
     ]
 
     passed = sum(1 for c in checks if c.get("passed") or c.get("skipped"))
@@ -651,13 +892,21 @@ def audit_repo(repo_path: Path) -> dict:
     }
 
 
-def run_audit(repos_dir: Path, repo_filter: str | None = None) -> dict:
+def run_audit(
+    repos_dir: Path,
+    repo_filter: str | None = None,
+    on_result: Callable[[dict], None] | None = None,
+    skip: frozenset[str] = frozenset(),
+) -> dict:
     """
     Run audit on all repositories in directory.
 
     Args:
         repos_dir: Directory containing repositories
         repo_filter: Optional filter to match repo names
+        on_result: Optional callback invoked with each repo result as soon
+            as that repo finishes (used to stream progress to disk)
+        skip: Check IDs to leave out (reported as skipped)
 
     Returns:
         Complete audit report as dict
@@ -674,10 +923,7 @@ def run_audit(repos_dir: Path, repo_filter: str | None = None) -> dict:
         }
 
     # Find repos
-    repos = find_repos(repos_dir)
-
-    if repo_filter:
-        repos = [r for r in repos if repo_filter.lower() in r.name.lower()]
+    repos = find_repos(repos_dir, name_filter=repo_filter)
 
     if not repos:
         return {
@@ -685,13 +931,19 @@ def run_audit(repos_dir: Path, repo_filter: str | None = None) -> dict:
             "repos_dir": str(repos_dir),
         }
 
-    # Detect GitHub user
-    github_user = detect_github_user(repos_dir)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Detect GitHub user while the repos are audited
+        github_user_future = executor.submit(detect_github_user, repos_dir)
 
-    # Run audit on each repo
-    results = []
-    for repo in repos:
-        results.append(audit_repo(repo))
+        # Run audit on each repo
+        results = []
+        for repo in repos:
+            result = audit_repo(repo, skip)
+            if on_result:
+                on_result(result)
+            results.append(result)
+
+        github_user = github_user_future.result()
 
     # Calculate overall summary
     total_checks = sum(r["summary"]["total"] for r in results)
@@ -741,18 +993,18 @@ def main():
         action="store_true",
         help="Output as JSON to stdout",
     )
+    parser.add_argument(
+        "--skip",
+        default="",
+        help="Comma-separated check IDs to skip; aliases: gh, pii, uv (e.g. --skip uv,gh)",
+    )
 
     args = parser.parse_args()
 
-    # Run audit
-    report = run_audit(args.repos_dir, args.filter)
-
-    # Handle errors
-    if "error" in report:
-        print(f"Error: {report['error']}", file=sys.stderr)
-        if args.json:
-            print(json.dumps(report, indent=2))
-        sys.exit(1)
+    try:
+        skip = parse_skip(args.skip)
+    except ValueError as e:
+        parser.error(str(e))
 
     # Determine output path
     output_path = args.output
@@ -761,11 +1013,37 @@ def main():
         claude_dir.mkdir(exist_ok=True)
         output_path = claude_dir / "repo-maintain-audit.json"
 
-    # Write report
-    output_path.write_text(json.dumps(report, indent=2))
+    # Run audit, appending each repo result to a JSONL sidecar as it
+    # completes so an interrupted run keeps its progress
+    progress_path = output_path.with_suffix(".jsonl")
+    if progress_path == output_path:
+        # --output already ends in .jsonl; don't let the report overwrite it
+        progress_path = output_path.with_name(output_path.stem + ".progress.jsonl")
+    with progress_path.open("w", encoding="utf-8") as progress:
+        def write_progress(result: dict) -> None:
+            progress.write(json.dumps(result) + "\n")
+            progress.flush()
+
+        report = run_audit(args.repos_dir, args.filter, on_result=write_progress, skip=skip)
+
+    # Handle errors
+    if "error" in report:
+        print(f"Error: {report['error']}", file=sys.stderr)
+        if args.json:
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        sys.exit(1)
+
+    # Write report (serialized once, straight to the file)
+    with output_path.open("w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
 
     if args.json:
-        print(json.dumps(report, indent=2))
+        # Echo the file rather than serializing the report a second time
+        sys.stdout.flush()
+        with output_path.open("rb") as f:
+            shutil.copyfileobj(f, sys.stdout.buffer)
+        sys.stdout.buffer.write(b"\n")
     else:
         print(f"Audit Report")
         print(f"============")
@@ -786,6 +1064,7 @@ def main():
                 print()
 
         print(f"Report saved to: {output_path}")
+        print(f"Per-repo progress: {progress_path}")
 
     # Exit code based on results
     if report["summary"]["failed"] > 0:
@@ -19,7 +19,11 @@ Output:
 
 import argparse
 import json
+import os
+import stat
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -28,7 +32,10 @@ SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
 # Import local utilities (bundled with plugin for portability)
-from repo_utils import find_repos
+from repo_utils import dump_json, find_repos, load_json, print_json
+
+# Concurrent repos; the work is small file reads/writes that release the GIL
+DEFAULT_WORKERS = 8
 
 SANDBOX_SETTINGS = {
     "sandbox": {
@@ -41,25 +48,75 @@ SANDBOX_SETTINGS = {
 }
 
 
-def has_sandbox_enabled(repo_path: Path) -> bool:
-    """Check if repo already has sandbox.enabled: true."""
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically via a sibling temp file and os.replace.
+
+    A killed process leaves either the old file or the new one, never a
+    partial write. The existing file's permissions are kept (0644 if new),
+    and a symlinked file is written through to its target rather than
+    replaced by a regular file.
+    """
+    target = Path(os.path.realpath(path))
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except OSError:
+        mode = 0o644
+
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        try:
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def has_sandbox_enabled(repo_path: Path) -> tuple[bool, dict | None, Path | None]:
+    """Check if repo already has sandbox.enabled: true.
+
+    Files without a "sandbox" key anywhere in their bytes are ruled out
+    without being parsed.
+
+    Returns:
+        (enabled, parsed_data, settings_path) where parsed_data is the last
+        settings file parsed (None if none was), so callers can reuse it
+        instead of parsing again
+    """
     claude_dir = repo_path / ".claude"
     settings_files = [
         claude_dir / "settings.json",
         claude_dir / "settings.local.json",
     ]
 
+    parsed, parsed_path = None, None
     for settings_file in settings_files:
-        if settings_file.exists():
-            try:
-                content = settings_file.read_text(encoding="utf-8", errors="ignore")
-                data = json.loads(content)
-                if isinstance(data.get("sandbox"), dict) and data["sandbox"].get("enabled") is True:
-                    return True
-            except (json.JSONDecodeError, Exception):
-                pass
-
-    return False
+        try:
+            raw = settings_file.read_bytes()
+        except OSError:
+            continue
+        if b'"sandbox"' not in raw:
+            continue
+        try:
+            data = load_json(raw)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+            continue
+        parsed, parsed_path = data, settings_file
+        if (
+            isinstance(data, dict)
+            and isinstance(data.get("sandbox"), dict)
+            and data["sandbox"].get("enabled") is True
+        ):
+            return True, parsed, parsed_path
+
+    return False, parsed, parsed_path
 
 
 def create_sandbox_settings(repo_path: Path, dry_run: bool = False) -> dict:
@@ -73,7 +130,8 @@ def create_sandbox_settings(repo_path: Path, dry_run: bool = False) -> dict:
     }
 
     # Check if already configured
-    if has_sandbox_enabled(repo_path):
+    enabled, parsed, parsed_path = has_sandbox_enabled(repo_path)
+    if enabled:
         result["status"] = "skipped"
         result["reason"] = "sandbox already enabled"
         return result
@@ -87,13 +145,18 @@ def create_sandbox_settings(repo_path: Path, dry_run: bool = False) -> dict:
         # Create .claude directory if needed
         claude_dir.mkdir(parents=True, exist_ok=True)
 
-        # Check if settings.local.json exists and merge
+        # Check if settings.local.json exists and merge (reusing the parse
+        # from the sandbox check when it got that far)
         existing_settings = {}
-        if settings_file.exists():
+        if parsed_path == settings_file:
+            existing_settings = parsed
+        else:
             try:
-                existing_settings = json.loads(settings_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, Exception):
+                existing_settings = load_json(settings_file.read_bytes())
+            except (json.JSONDecodeError, OSError):
                 pass
+        if not isinstance(existing_settings, dict):
+            existing_settings = {}
 
         # Merge: add sandbox.enabled, preserve existing permissions
         merged = existing_settings.copy()
@@ -102,10 +165,7 @@ def create_sandbox_settings(repo_path: Path, dry_run: bool = False) -> dict:
             merged["permissions"] = {"allow": [], "deny": []}
 
         # Write the file
-        settings_file.write_text(
-            json.dumps(merged, indent=2) + "\n",
-            encoding="utf-8"
-        )
+        write_atomic(settings_file, dump_json(merged))
 
         result["status"] = "created"
         result["content"] = merged
@@ -137,28 +197,29 @@ def main():
         action="store_true",
         help="Show what would be done without making changes",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Repos to process concurrently (default: {DEFAULT_WORKERS})",
+    )
 
     args = parser.parse_args()
 
     # Find repos
-    repos = find_repos(args.repos_dir)
-
-    if args.filter:
-        repos = [r for r in repos if args.filter.lower() in r.name.lower()]
+    repos = find_repos(args.repos_dir, name_filter=args.filter)
 
     if not repos:
-        print(json.dumps({
+        print_json({
             "error": "No repositories found",
             "repos_dir": str(args.repos_dir),
             "filter": args.filter,
-        }, indent=2))
+        })
         sys.exit(1)
 
-    # Process repos
-    results = []
-    for repo in repos:
-        result = create_sandbox_settings(repo, dry_run=args.dry_run)
-        results.append(result)
+    # Process repos (results keep the input order)
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        results = list(executor.map(lambda repo: create_sandbox_settings(repo, dry_run=args.dry_run), repos))
 
     # Summary
     created = sum(1 for r in results if r["status"] in ("created", "would_create"))
@@ -179,7 +240,7 @@ def main():
         "results": results,
     }
 
-    print(json.dumps(report, indent=2))
+    print_json(report)
 
     if errors > 0:
         sys.exit(1)
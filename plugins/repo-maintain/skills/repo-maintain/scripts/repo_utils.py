@@ -5,37 +5,161 @@
 """
 Repository discovery utilities.
 
-Provides functions for finding git repositories in a directory.
+Provides functions for finding git repositories in a directory, getting
+a GitHub token from the gh CLI, and reading/writing JSON (with orjson when
+it is installed).
 """
 
 import argparse
+import json
+import os
+import shutil
+import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Optional: faster JSON when orjson is installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def find_repos(repos_dir: Path) -> list[Path]:
+# Above this many subdirectories, .git probes run concurrently; on network
+# and FUSE mounts each probe is a round-trip
+PARALLEL_PROBE_THRESHOLD = 50
+PROBE_WORKERS = 8
+
+# Per-user cache shared by the repo-maintain scripts
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "repo-maintain"
+
+# gh token cache, shared by the repo-maintain scripts within a session
+GH_TOKEN_CACHE = CACHE_DIR / "gh-token"
+GH_TOKEN_TTL = 300
+
+
+def _is_repo(path: str) -> bool:
+    """Check whether a directory contains .git."""
+    return os.path.exists(os.path.join(path, ".git"))
+
+
+def load_json(raw: bytes):
+    """Parse JSON from raw bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8", errors="ignore"))
+
+
+def dump_json(data) -> bytes:
+    """Serialize to 2-space indented JSON bytes with a trailing newline."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def print_json(data) -> None:
+    """Write indented JSON to stdout in a single write."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(data))
+    sys.stdout.buffer.flush()
+
+
+def find_repos(repos_dir: Path, name_filter: str | None = None) -> list[Path]:
     """
     Find all git repositories in directory.
 
+    Uses one os.scandir pass; DirEntry.is_dir() reuses the file type from
+    the directory listing, so only the .git probe costs a stat. Large
+    directories probe on a small thread pool.
+
     Args:
         repos_dir: Directory to search for repositories
+        name_filter: Optional case-insensitive substring the directory name
+            must contain; non-matching entries are never probed
 
     Returns:
         List of paths to repositories, sorted by name (case-insensitive)
     """
-    repos = []
     repos_dir = Path(repos_dir).resolve()
 
     if not repos_dir.exists():
-        return repos
+        return []
+
+    needle = name_filter.lower() if name_filter else None
+
+    with os.scandir(repos_dir) as entries:
+        candidates = [
+            entry.path
+            for entry in entries
+            if (needle is None or needle in entry.name.lower()) and entry.is_dir()
+        ]
+
+    if len(candidates) > PARALLEL_PROBE_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+            flags = list(executor.map(_is_repo, candidates))
+    else:
+        flags = [_is_repo(path) for path in candidates]
 
-    for item in repos_dir.iterdir():
-        if item.is_dir() and (item / ".git").exists():
-            repos.append(item)
+    repos = [Path(path) for path, is_repo in zip(candidates, flags) if is_repo]
 
     return sorted(repos, key=lambda p: p.name.lower())
 
 
+def get_gh_token(ttl: int = GH_TOKEN_TTL) -> str | None:
+    """
+    Get a GitHub token, reusing a recent `gh auth token` result.
+
+    GH_TOKEN / GITHUB_TOKEN win, like in gh itself. Otherwise a token
+    cached less than `ttl` seconds ago is returned; on a miss gh is asked
+    once and the result cached (mode 0600) for the next script.
+
+    Returns:
+        Token string, or None if gh is missing or not authenticated
+    """
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+
+    try:
+        if time.time() - GH_TOKEN_CACHE.stat().st_mtime < ttl:
+            token = GH_TOKEN_CACHE.read_text(encoding="utf-8").strip()
+            if token:
+                return token
+    except OSError:
+        pass
+
+    if not shutil.which("gh"):
+        return None
+
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    token = result.stdout.strip()
+    if result.returncode != 0 or not token:
+        return None
+
+    # mkstemp creates the file 0600; os.replace swaps it in atomically
+    try:
+        GH_TOKEN_CACHE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=GH_TOKEN_CACHE.parent)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(token)
+        os.replace(tmp, GH_TOKEN_CACHE)
+    except OSError:
+        pass
+
+    return token
+
+
 def run_tests() -> bool:
     """Self-test the repo discovery logic."""
     import tempfile
@@ -104,6 +228,55 @@ def run_tests() -> bool:
         else:
             print("PASS: Case-insensitive sorting")
 
+        # Test 4b: Name filter is a case-insensitive substring
+        repo_names = [r.name for r in find_repos(tmpdir, name_filter="Et")]
+
+        if repo_names != ["BETA"]:
+            print(f"FAIL: Expected name filter ['BETA'], got {repo_names}", file=sys.stderr)
+            all_passed = False
+        else:
+            print("PASS: Name filter")
+
+    # Test 5: Large directories (parallel probes) find the same repos
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+
+        expected = []
+        for i in range(PARALLEL_PROBE_THRESHOLD + 10):
+            name = f"dir-{i:03d}"
+            (tmpdir / name).mkdir()
+            if i % 2 == 0:
+                (tmpdir / name / ".git").mkdir()
+                expected.append(name)
+
+        repo_names = [r.name for r in find_repos(tmpdir)]
+
+        if repo_names != expected:
+            print(f"FAIL: Parallel probe expected {len(expected)} repos, got {len(repo_names)}", file=sys.stderr)
+            all_passed = False
+        else:
+            print("PASS: Parallel probes on large directory")
+
+    # Test 6: Fresh cached gh token is reused without running gh
+    global GH_TOKEN_CACHE
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orig_cache = GH_TOKEN_CACHE
+        orig_env = {k: os.environ.pop(k, None) for k in ("GH_TOKEN", "GITHUB_TOKEN")}
+        GH_TOKEN_CACHE = Path(tmpdir) / "gh-token"
+        GH_TOKEN_CACHE.write_text("cached-token\n")
+
+        token = get_gh_token()
+        if token != "cached-token":
+            print(f"FAIL: Expected cached token, got {token!r}", file=sys.stderr)
+            all_passed = False
+        else:
+            print("PASS: Cached gh token")
+
+        GH_TOKEN_CACHE = orig_cache
+        for key, value in orig_env.items():
+            if value is not None:
+                os.environ[key] = value
+
     return all_passed
 
 
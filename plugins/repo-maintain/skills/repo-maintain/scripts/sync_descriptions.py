@@ -6,22 +6,29 @@
 Sync GitHub repository descriptions from README taglines.
 
 Extracts taglines from README.md files and updates GitHub repo descriptions
-using the gh CLI.
+through the GitHub API, authenticating with the gh CLI's (cached) token.
 
 Usage:
     uv run scripts/sync_descriptions.py --repos-dir /path/to/repos
     uv run scripts/sync_descriptions.py --repos-dir /path/to/repos --dry-run
     uv run scripts/sync_descriptions.py --repos-dir /path/to/repos --filter "sandbox"
+    uv run scripts/sync_descriptions.py --repos-dir /path/to/repos --incremental
 
 Output:
     JSON report to stdout with success/failure per repo
 """
 
 import argparse
+import hashlib
+import http.client
 import json
-import shutil
+import os
+import re
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -31,48 +38,192 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 # Import local utilities (bundled with plugin for portability)
 from extract_tagline import extract_tagline
-from repo_utils import find_repos
+from repo_utils import CACHE_DIR, find_repos, get_gh_token, print_json
 
+# Concurrent repos; each blocks on API calls, kept modest to stay under
+# GitHub's secondary rate limits
+DEFAULT_WORKERS = 8
 
-def check_gh_cli() -> bool:
-    """Check if gh CLI is available and authenticated."""
-    if not shutil.which("gh"):
-        return False
+# Below this many repos needing a lookup, per-repo GETs are cheaper than
+# paging through every repo the user owns
+BULK_FETCH_MIN_REPOS = 10
 
+GITHUB_API_HOST = "api.github.com"
+
+# README hash and synced description per repo, for --incremental
+STATE_FILE = CACHE_DIR / "sync-state.json"
+
+# owner/name from a GitHub remote URL (https or ssh, with or without .git)
+_GITHUB_SLUG = re.compile(r"github\.com[:/]([^/\s]+)/([^/\s]+?)(?:\.git)?/?\s*$", re.MULTILINE)
+
+# Body of the [remote "origin"] section in .git/config
+_ORIGIN_SECTION = re.compile(r'^\[remote "origin"\]\s*$(.*?)(?=^\[|\Z)', re.MULTILINE | re.DOTALL)
+
+
+class GitHubClient:
+    """
+    Minimal GitHub API client over keep-alive HTTPS.
+
+    Each thread holds one persistent connection, so a sync run pays the TLS
+    handshake once per worker instead of spawning gh for every call.
+    """
+
+    def __init__(self, token: str, timeout: float = 30):
+        self.token = token
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def request(self, method: str, path: str, body: dict | None = None) -> tuple[int, dict | None]:
+        """
+        Send a request and decode the JSON response.
+
+        Retries once on a fresh connection if the kept-alive one was dropped.
+
+        Returns:
+            (status, parsed JSON body or None)
+        """
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "repo-maintain-sync-descriptions",
+        }
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+
+        try:
+            parsed = json.loads(data) if data else None
+        except json.JSONDecodeError:
+            parsed = None
+        return response.status, parsed
+
+
+def get_repo_slug(repo_path: Path) -> str | None:
+    """
+    Get the GitHub owner/name slug from the repo's origin remote.
+
+    Reads .git/config directly; only spawns git when it can't be read
+    (e.g. worktrees, where .git is a file).
+
+    Returns:
+        "owner/name", or None if origin is not a GitHub remote
+    """
     try:
-        result = subprocess.run(
-            ["gh", "auth", "status"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return result.returncode == 0
+        config = (repo_path / ".git" / "config").read_text(encoding="utf-8", errors="ignore")
+        section = _ORIGIN_SECTION.search(config)
+        url = section.group(1) if section else ""
+    except OSError:
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(repo_path), "remote", "get-url", "origin"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            url = result.stdout if result.returncode == 0 else ""
+        except Exception:
+            url = ""
+
+    match = _GITHUB_SLUG.search(url)
+    return f"{match.group(1)}/{match.group(2)}" if match else None
+
+
+# All repos owned by the authenticated user, one page of 100 per request
+_VIEWER_REPOS_QUERY = """
+query($endCursor: String) {
+  viewer {
+    repositories(first: 100, after: $endCursor, ownerAffiliations: OWNER) {
+      nodes { nameWithOwner description }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+def fetch_github_descriptions(client: GitHubClient) -> dict[str, str]:
+    """
+    Fetch descriptions for all of the authenticated user's repos at once.
+
+    Pages through one GraphQL query instead of one request per repo.
+    Returns an empty dict on any failure so callers fall back to per-repo
+    lookups.
+
+    Returns:
+        Mapping of "owner/name" -> description ("" when unset)
+    """
+    descriptions = {}
+    cursor = None
+    try:
+        while True:
+            status, page = client.request(
+                "POST",
+                "/graphql",
+                {"query": _VIEWER_REPOS_QUERY, "variables": {"endCursor": cursor}},
+            )
+            if status != 200 or not page or "data" not in page:
+                return {}
+            repos = page["data"]["viewer"]["repositories"]
+            for node in repos["nodes"]:
+                descriptions[node["nameWithOwner"]] = node.get("description") or ""
+            if not repos["pageInfo"]["hasNextPage"]:
+                return descriptions
+            cursor = repos["pageInfo"]["endCursor"]
     except Exception:
-        return False
+        return {}
+
 
+def get_github_description(
+    client: GitHubClient,
+    slug: str,
+    descriptions: dict[str, str] | None = None,
+) -> str | None:
+    """Get current GitHub description for an owner/name slug.
+
+    Looks in the prefetched `descriptions` first and only queries the
+    REST API on a miss.
+    """
+    if descriptions and slug in descriptions:
+        return descriptions[slug]
 
-def get_github_description(repo_path: Path) -> str | None:
-    """Get current GitHub description for a repo."""
     try:
-        result = subprocess.run(
-            ["gh", "repo", "view", repo_path.name, "--json", "description"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=str(repo_path),
-        )
-
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
+        status, data = client.request("GET", f"/repos/{slug}")
+        if status == 200 and data is not None:
             return data.get("description", "") or ""
     except Exception:
         pass
     return None
 
 
-def set_github_description(repo_path: Path, description: str, dry_run: bool = False) -> tuple[bool, str]:
+def set_github_description(
+    client: GitHubClient,
+    slug: str,
+    description: str,
+    dry_run: bool = False,
+) -> tuple[bool, str]:
     """
-    Set GitHub description for a repo.
+    Set GitHub description for an owner/name slug.
 
     Returns:
         (success, message) tuple
@@ -81,29 +232,73 @@ def set_github_description(repo_path: Path, description: str, dry_run: bool = Fa
         return True, f"[DRY RUN] Would set description: {description}"
 
     try:
-        result = subprocess.run(
-            ["gh", "repo", "edit", "--description", description],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(repo_path),
-        )
-
-        if result.returncode == 0:
+        status, data = client.request("PATCH", f"/repos/{slug}", {"description": description})
+
+        if status == 200:
             return True, "Description updated"
         else:
-            return False, f"gh error: {result.stderr.strip()}"
+            message = (data or {}).get("message", "unknown error")
+            return False, f"GitHub API error ({status}): {message}"
 
-    except subprocess.TimeoutExpired:
-        return False, "Timeout executing gh command"
+    except TimeoutError:
+        return False, "Timeout calling GitHub API"
     except Exception as e:
         return False, f"Error: {e}"
 
 
-def sync_repo(repo_path: Path, dry_run: bool = False) -> dict:
+def load_state() -> dict:
+    """Load the incremental sync state (empty if missing or unreadable)."""
+    try:
+        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state: dict) -> None:
+    """Atomically save the incremental sync state."""
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=STATE_FILE.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, STATE_FILE)
+
+
+def readme_sha256(repo_path: Path) -> str | None:
+    """SHA-256 of the repo's README.md (None if it can't be read)."""
+    try:
+        return hashlib.sha256((repo_path / "README.md").read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def is_unchanged(state: dict, repo_path: Path, readme_hash: str | None) -> bool:
+    """Whether the README hash matches the one recorded at the last sync."""
+    known = state.get(str(repo_path))
+    return bool(known) and readme_hash is not None and known.get("readme_sha256") == readme_hash
+
+
+def sync_repo(
+    client: GitHubClient,
+    repo_path: Path,
+    dry_run: bool = False,
+    descriptions: dict[str, str] | None = None,
+    state: dict | None = None,
+    readme_hash: str | None = None,
+) -> dict:
     """
     Sync description for a single repo.
 
+    Args:
+        client: Authenticated GitHub API client
+        repo_path: Repository to sync
+        dry_run: Report changes without applying them
+        descriptions: Optional prefetched owner/name -> description mapping
+        state: Optional incremental state; repos whose README is unchanged
+            since they were last synced are skipped without any API call,
+            and repos found in sync are recorded in it
+        readme_hash: README hash already computed by the caller (computed
+            here when needed and not given)
+
     Returns:
         Result dict with status and details
     """
@@ -119,23 +314,45 @@ def sync_repo(repo_path: Path, dry_run: bool = False) -> dict:
         "message": None,
     }
 
-    # Check README exists
-    if not readme_path.exists():
+    # Check README exists (the stat is reused for the tagline cache key)
+    try:
+        readme_stat = readme_path.stat()
+    except OSError:
         result["status"] = "skipped"
         result["message"] = "No README.md found"
         return result
 
+    # Incremental: trust the last sync if the README hasn't changed
+    if state is not None:
+        if readme_hash is None:
+            readme_hash = readme_sha256(repo_path)
+        if is_unchanged(state, repo_path, readme_hash):
+            known = state[str(repo_path)]
+            result["status"] = "synced"
+            result["tagline"] = known["description"]
+            result["current_description"] = known["description"]
+            result["message"] = "README unchanged since last sync"
+            return result
+
     # Extract tagline
-    tagline = extract_tagline(readme_path)
+    tagline = extract_tagline(readme_path, readme_stat)
     if not tagline:
         result["status"] = "skipped"
         result["message"] = "Could not extract tagline from README"
         return result
 
     result["tagline"] = tagline
+    tagline_norm = tagline.strip().casefold()
+
+    # Resolve owner/name from the origin remote
+    slug = get_repo_slug(repo_path)
+    if slug is None:
+        result["status"] = "skipped"
+        result["message"] = "No GitHub origin remote"
+        return result
 
     # Get current description
-    current = get_github_description(repo_path)
+    current = get_github_description(client, slug, descriptions)
     if current is None:
         result["status"] = "skipped"
         result["message"] = "Could not fetch GitHub description (not a GitHub repo?)"
@@ -144,17 +361,21 @@ def sync_repo(repo_path: Path, dry_run: bool = False) -> dict:
     result["current_description"] = current
 
     # Check if already synced
-    if current.strip().lower() == tagline.strip().lower():
+    if current.strip().casefold() == tagline_norm:
         result["status"] = "synced"
         result["message"] = "Already in sync"
+        if state is not None:
+            state[str(repo_path)] = {"readme_sha256": readme_hash, "description": current}
         return result
 
     # Update description
-    success, message = set_github_description(repo_path, tagline, dry_run)
+    success, message = set_github_description(client, slug, tagline, dry_run)
 
     if success:
         result["status"] = "updated" if not dry_run else "would_update"
         result["message"] = message
+        if state is not None and not dry_run:
+            state[str(repo_path)] = {"readme_sha256": readme_hash, "description": tagline}
     else:
         result["status"] = "failed"
         result["message"] = message
@@ -162,27 +383,42 @@ def sync_repo(repo_path: Path, dry_run: bool = False) -> dict:
     return result
 
 
-def sync_all(repos_dir: Path, repo_filter: str | None = None, dry_run: bool = False) -> dict:
+def sync_all(
+    repos_dir: Path,
+    repo_filter: str | None = None,
+    dry_run: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    incremental: bool = False,
+) -> dict:
     """
     Sync descriptions for all repos in directory.
 
+    Repos are synced concurrently on up to `workers` threads; results keep
+    the input order. With `incremental`, repos whose README hasn't changed
+    since their last sync are skipped; edits made on GitHub in the meantime
+    go unnoticed until the README changes or a full run.
+
+    READMEs are hashed before any network call, so only repos that still
+    need a lookup count towards the batched description prefetch; with
+    fewer than BULK_FETCH_MIN_REPOS of them (e.g. --filter for one repo, or
+    an incremental run with nothing changed) each is looked up on its own.
+
     Returns:
         Report dict with results for each repo
     """
     repos_dir = Path(repos_dir).resolve()
 
-    # Check gh CLI
-    if not check_gh_cli():
+    # Get an API token from gh
+    token = get_gh_token()
+    if not token:
         return {
             "error": "gh CLI not available or not authenticated (run: gh auth login)",
             "repos_dir": str(repos_dir),
         }
+    client = GitHubClient(token)
 
     # Find repos
-    repos = find_repos(repos_dir)
-
-    if repo_filter:
-        repos = [r for r in repos if repo_filter.lower() in r.name.lower()]
+    repos = find_repos(repos_dir, name_filter=repo_filter)
 
     if not repos:
         return {
@@ -190,10 +426,34 @@ def sync_all(repos_dir: Path, repo_filter: str | None = None, dry_run: bool = Fa
             "repos_dir": str(repos_dir),
         }
 
-    # Sync each repo
-    results = []
-    for repo in repos:
-        results.append(sync_repo(repo, dry_run))
+    # Each worker only writes its own repo's key, so the dict is shared as is
+    state = load_state() if incremental else None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        # Hash READMEs first so unchanged repos never reach the network
+        if state is not None:
+            hashes = list(executor.map(readme_sha256, repos))
+            pending = sum(
+                1 for repo, readme_hash in zip(repos, hashes)
+                if readme_hash is not None and not is_unchanged(state, repo, readme_hash)
+            )
+        else:
+            hashes = [None] * len(repos)
+            pending = len(repos)
+
+        # Prefetch current descriptions in one batched query when enough
+        # repos need one
+        descriptions = fetch_github_descriptions(client) if pending >= BULK_FETCH_MIN_REPOS else {}
+
+        # Sync each repo (API calls are I/O bound, so threads overlap them)
+        results = list(executor.map(
+            lambda repo, readme_hash: sync_repo(client, repo, dry_run, descriptions, state, readme_hash),
+            repos,
+            hashes,
+        ))
+
+    if state is not None and not dry_run:
+        save_state(state)
 
     # Summarize
     summary = {
@@ -239,21 +499,32 @@ def main():
         action="store_true",
         help="Output full JSON report (default: summary only)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Repos to sync concurrently (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip repos whose README is unchanged since their last sync",
+    )
 
     args = parser.parse_args()
 
     # Run sync
-    report = sync_all(args.repos_dir, args.filter, args.dry_run)
+    report = sync_all(args.repos_dir, args.filter, args.dry_run, args.workers, args.incremental)
 
     # Handle errors
     if "error" in report:
         print(f"Error: {report['error']}", file=sys.stderr)
         if args.json:
-            print(json.dumps(report, indent=2))
+            print_json(report)
         sys.exit(1)
 
     if args.json:
-        print(json.dumps(report, indent=2))
+        print_json(report)
     else:
         # Human-readable output
         print(f"Description Sync Report")
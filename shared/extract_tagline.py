@@ -22,19 +22,37 @@ Returns:
 """
 
 import argparse
+import io
+import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # GitHub description limit
 MAX_LENGTH = 350
 
+# Lines scanned for a tagline before giving up
+MAX_SCAN_LINES = 100
+
+# Precompiled patterns (called once per README line)
+_FRONTMATTER_END = re.compile(r"^---\s*$", re.MULTILINE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+_HTML_START = re.compile(r"^</?[a-zA-Z][^>]*>")
+_LINK_ONLY = re.compile(r"^\s*\[([^\]]+)\]\([^)]+\)(\s*·\s*\[([^\]]+)\]\([^)]+\))*\s*$")
+_REF_LINK = re.compile(r"^\[[^\]]+\]:\s*\S+")
+_HR = re.compile(r"^[-*_]{3,}\s*$")
+_BOLD = re.compile(r"\*\*([^*]+)\*\*")
+_ITAL_STAR = re.compile(r"\*([^*]+)\*")
+_ITAL_UND = re.compile(r"_([^_]+)_")
+_CODE = re.compile(r"`([^`]+)`")
+
 
 def strip_yaml_frontmatter(content: str) -> str:
     """Remove YAML frontmatter if present."""
     if content.startswith("---"):
         # Find closing ---
-        match = re.search(r"^---\s*$", content[3:], re.MULTILINE)
+        match = _FRONTMATTER_END.search(content[3:])
         if match:
             return content[3 + match.end():].lstrip()
     return content
@@ -42,7 +60,7 @@ def strip_yaml_frontmatter(content: str) -> str:
 
 def strip_html_tags(line: str) -> str:
     """Remove HTML tags from a line."""
-    return re.sub(r"<[^>]+>", "", line)
+    return _HTML_TAG.sub("", line)
 
 
 def is_skip_line(line: str) -> bool:
@@ -68,21 +86,21 @@ def is_skip_line(line: str) -> bool:
     # HTML tags (div, img, br, p, etc.)
     if stripped.startswith("<") and not stripped.startswith("<http"):
         # Check if it's an HTML tag (not a broken link or something else)
-        if re.match(r"^</?[a-zA-Z][^>]*>", stripped):
+        if _HTML_START.match(stripped):
             return True
 
     # Link-only lines: [text](url) or [text][ref]
     # Match lines that are ONLY links with optional whitespace
-    link_only = re.match(r"^\s*\[([^\]]+)\]\([^)]+\)(\s*·\s*\[([^\]]+)\]\([^)]+\))*\s*$", stripped)
+    link_only = _LINK_ONLY.match(stripped)
     if link_only:
         return True
 
     # Reference-style link definitions: [text]: url
-    if re.match(r"^\[[^\]]+\]:\s*\S+", stripped):
+    if _REF_LINK.match(stripped):
         return True
 
     # Horizontal rules (---, ***, ___)
-    if re.match(r"^[-*_]{3,}\s*$", stripped):
+    if _HR.match(stripped):
         return True
 
     # Lines that are only HTML after stripping
@@ -108,14 +126,14 @@ def extract_tagline_text(line: str) -> str:
     text = strip_html_tags(text)
 
     # Remove bold markdown: **text** -> text
-    text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)
+    text = _BOLD.sub(r"\1", text)
 
     # Remove italic markdown: *text* or _text_ -> text
-    text = re.sub(r"\*([^*]+)\*", r"\1", text)
-    text = re.sub(r"_([^_]+)_", r"\1", text)
+    text = _ITAL_STAR.sub(r"\1", text)
+    text = _ITAL_UND.sub(r"\1", text)
 
     # Remove inline code: `text` -> text
-    text = re.sub(r"`([^`]+)`", r"\1", text)
+    text = _CODE.sub(r"\1", text)
 
     # Clean up extra whitespace
     text = " ".join(text.split())
@@ -123,10 +141,41 @@ def extract_tagline_text(line: str) -> str:
     return text.strip()
 
 
-def extract_tagline(readme_path: Path) -> str | None:
+def extract_tagline(readme_path: Path, st: os.stat_result | None = None) -> str | None:
     """
     Extract tagline from README.md.
 
+    Results are cached per (path, mtime, size), so repeated calls on an
+    unchanged file skip the read and parse. Callers that already stat'ed
+    the file can pass `st` to save another stat.
+
+    Returns:
+        Tagline string or None if not found
+    """
+    if st is None:
+        try:
+            st = readme_path.stat()
+        except OSError:
+            return None
+
+    return _extract_tagline_cached(str(readme_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _extract_tagline_cached(path: str, mtime_ns: int, size: int) -> str | None:
+    """Read and parse a README (mtime_ns and size only key the cache)."""
+    try:
+        content = Path(path).read_text(encoding="utf-8", errors="ignore")
+    except Exception:
+        return None
+
+    return extract_tagline_from_text(content)
+
+
+def extract_tagline_from_text(content: str) -> str | None:
+    """
+    Extract tagline from README content that has already been read.
+
     Strategy:
     1. Remove YAML frontmatter
     2. Scan lines, skipping headers/badges/HTML/links
@@ -137,17 +186,14 @@ def extract_tagline(readme_path: Path) -> str | None:
     Returns:
         Tagline string or None if not found
     """
-    try:
-        content = readme_path.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
-        return None
-
     # Strip YAML frontmatter
     content = strip_yaml_frontmatter(content)
 
-    lines = content.splitlines()
+    # Iterate lazily; taglines sit near the top, so give up after a bounded scan
+    for i, line in enumerate(io.StringIO(content, newline=None)):
+        if i >= MAX_SCAN_LINES:
+            break
 
-    for line in lines:
         if is_skip_line(line):
             continue
 
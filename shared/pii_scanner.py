@@ -18,8 +18,10 @@ import argparse
 import fnmatch
 import json
 import re
+import stat
 import sys
 from pathlib import Path
+from typing import Iterable
 
 # Credential detection patterns
 PATTERNS = {
@@ -139,18 +141,18 @@ def is_ignored(file_path: Path, repo_path: Path, gitignore_patterns: list[str])
     return False
 
 
-def should_skip_file(file_path: Path) -> bool:
+def should_skip_file(file_path: Path, skip_extensions: set[str] = SKIP_EXTENSIONS) -> bool:
     """Check if file should be skipped based on extension or name."""
-    if file_path.suffix.lower() in SKIP_EXTENSIONS:
+    if file_path.suffix.lower() in skip_extensions:
         return True
     if file_path.name.startswith("."):
         return True
     return False
 
 
-def should_skip_dir(dir_name: str) -> bool:
+def should_skip_dir(dir_name: str, skip_dirs: set[str] = SKIP_DIRS) -> bool:
     """Check if directory should be skipped."""
-    for pattern in SKIP_DIRS:
+    for pattern in skip_dirs:
         if fnmatch.fnmatch(dir_name, pattern):
             return True
     return False
@@ -184,13 +186,26 @@ def scan_file(file_path: Path) -> list[dict]:
     return findings
 
 
-def scan_repo(repo_path: Path, respect_gitignore: bool = True) -> dict:
+def scan_repo(
+    repo_path: Path,
+    respect_gitignore: bool = True,
+    files: Iterable[str] | None = None,
+    max_bytes: int | None = None,
+    extra_skip_dirs: Iterable[str] = (),
+    extra_skip_extensions: Iterable[str] = (),
+) -> dict:
     """
     Scan entire repository for credentials.
 
     Args:
         repo_path: Path to repository root
         respect_gitignore: If True, skip files matching .gitignore patterns
+        files: Optional repo-relative paths to scan instead of walking the
+            tree (e.g. from `git ls-files`). The list is trusted to already
+            exclude ignored files, so .gitignore matching is skipped.
+        max_bytes: Optional size cap; larger files are skipped unread
+        extra_skip_dirs: Directory names/patterns to skip on top of SKIP_DIRS
+        extra_skip_extensions: Extensions to skip on top of SKIP_EXTENSIONS
 
     Returns:
         Dict with findings per file
@@ -200,7 +215,15 @@ def scan_repo(repo_path: Path, respect_gitignore: bool = True) -> dict:
     if not repo_path.exists():
         return {"error": f"Path does not exist: {repo_path}"}
 
+    if files is not None:
+        candidates = (repo_path / rel for rel in files)
+        respect_gitignore = False
+    else:
+        candidates = repo_path.rglob("*")
+
     gitignore_patterns = parse_gitignore(repo_path) if respect_gitignore else []
+    skip_dirs = SKIP_DIRS | set(extra_skip_dirs)
+    skip_extensions = SKIP_EXTENSIONS | {ext.lower() for ext in extra_skip_extensions}
 
     results = {
         "repo": str(repo_path),
@@ -211,16 +234,23 @@ def scan_repo(repo_path: Path, respect_gitignore: bool = True) -> dict:
         "by_severity": {"critical": 0, "high": 0, "medium": 0, "low": 0},
     }
 
-    for file_path in repo_path.rglob("*"):
-        if not file_path.is_file():
-            continue
-
+    for file_path in candidates:
         # Skip based on directory
-        if any(should_skip_dir(part) for part in file_path.relative_to(repo_path).parts):
+        if any(should_skip_dir(part, skip_dirs) for part in file_path.relative_to(repo_path).parts):
             continue
 
         # Skip based on file type
-        if should_skip_file(file_path):
+        if should_skip_file(file_path, skip_extensions):
+            continue
+
+        # Only then stat: regular files within the size cap
+        try:
+            st = file_path.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        if max_bytes is not None and st.st_size > max_bytes:
             continue
 
         # Skip if gitignored